@@ -0,0 +1,85 @@
+"""
+Measure how long it takes to start ignoring user input when End turn is clicked
+and to accept it again afterwards, comparing the full-screen overlay Toplevel
+the game used to create with InputLock.
+
+The overlay is measured through the code path of the windowing system the
+script runs on, so run it once on X11 and once on Windows. A display is required.
+Usage (from the sources directory): python -m benchmarks.input_gating [repeat]
+"""
+
+
+import statistics
+import sys
+import tkinter as tk
+from time import perf_counter
+
+from game.miscellaneous import InputLock
+
+
+def gate_with_overlay(window: tk.Tk, windowing_system: str) -> None:
+    overlay = tk.Toplevel(window)
+    overlay.wm_geometry(f"{window.winfo_screenwidth()}x{window.winfo_screenheight()}+0+0")
+
+    match windowing_system:
+        case "win32":
+            overlay.wm_attributes("-alpha", 0.01, "-disabled", 1, "-topmost", 1)
+            overlay.wm_overrideredirect(True)
+        case "x11":
+            overlay.wm_overrideredirect(True)
+            overlay.wait_visibility()
+            overlay.wm_attributes("-alpha", 0.01, "-topmost", 1)
+
+            # Wait until the overlay becomes transparent.
+            flag = tk.BooleanVar()
+            window.after(20, flag.set, True)
+            window.wait_variable(flag)
+
+    overlay.destroy()
+
+
+def gate_with_input_lock(input_lock: InputLock) -> None:
+    input_lock.acquire()
+    input_lock.release()
+
+
+def measure(func, repeat: int) -> list:
+    """
+    Return the wall time of every call to func in milliseconds.
+    """
+    durations = []
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        durations.append((perf_counter() - start) * 1000)
+
+    return durations
+
+
+def report(name: str, durations: list) -> None:
+    durations = sorted(durations)
+    print(
+        f"{name:<12}"
+        f" median {statistics.median(durations):10.4f} ms"
+        f"  p95 {durations[int(len(durations) * 0.95) - 1]:10.4f} ms"
+        f"  max {durations[-1]:10.4f} ms"
+    )
+
+
+def main() -> None:
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    window = tk.Tk()
+    windowing_system = window.call("tk", "windowingsystem")
+    window.update()
+
+    print(f"Windowing system: {windowing_system}, {repeat} repetitions")
+    report("overlay", measure(lambda: gate_with_overlay(window, windowing_system), repeat))
+    input_lock = InputLock()
+    report("InputLock", measure(lambda: gate_with_input_lock(input_lock), repeat * 1000))
+
+    window.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Measure how long the computer turn takes as the board grows, comparing the
+distance fields with the hierarchical search over the cluster graph.
+
+Every board gets walls on a tenth of its tiles, a barrack guarded by allies in
+the middle and enemies along the edges, then the enemies hunt for a number of
+turns while an ally is recruited at the start of each, as in a real game.
+No display is required.
+Usage (from the sources directory): python -m benchmarks.pathfinding [turns]
+"""
+
+
+import random
+import statistics
+import sys
+from time import perf_counter
+
+from game.configuration import Configuration as C
+from game.engine import World, units
+
+SIZES = ((21, 13), (32, 32), (64, 64), (128, 128), (256, 256))
+ALLY_COUNT = 12
+ENEMY_COUNT = 12
+
+
+def populate(world: World, seed: int) -> None:
+    rng = random.Random(seed)
+    board = world.board
+    cx, cy = world.width // 2, world.height // 2
+
+    units.Barrack(world, cx, cy)
+    for _ in range(ALLY_COUNT):
+        while True:
+            x, y = cx + rng.randint(-4, 4), cy + rng.randint(-4, 4)
+            if board.contains(x, y, margin=1) and board.is_vacant(x, y):
+                rng.choice((units.Archer, units.Cavalry, units.Infantry))(world, x, y, color=C.BLUE)
+                break
+
+    for _ in range(ENEMY_COUNT):
+        while True:
+            x, y = rng.choice((
+                (rng.randrange(world.width), rng.choice((0, world.height - 1))),
+                (rng.choice((0, world.width - 1)), rng.randrange(world.height)),
+            ))
+            if board.is_vacant(x, y):
+                rng.choice((units.Archer, units.Cavalry, units.Infantry))(world, x, y, color=C.RED)
+                break
+
+    for _ in range(world.width * world.height // 10):
+        x, y = rng.randrange(world.width), rng.randrange(world.height)
+        if board.is_vacant(x, y) and abs(x - cx) + abs(y - cy) > 5:
+            units.Wall(world, x, y)
+
+
+def measure(width: int, height: int, hierarchical: bool, turns: int) -> tuple:
+    """
+    Return the wall time of every computer turn and of the slowest hunt in
+    each of them, in milliseconds. The scheduler yields between hunts, so the
+    slowest hunt is the longest the window can stall.
+    """
+    world = World(width, height)
+    world.hierarchical = hierarchical
+    populate(world, seed=width * height)
+
+    turn_durations = []
+    hunt_durations = []
+    for _ in range(turns):
+        if world.defeated or not world.enemy_soldiers:
+            break
+
+        barrack = next(iter(world.critical_buildings), None)
+        if barrack and (neighbors := barrack.get_vacant_neighbors()):
+            units.Infantry(world, *neighbors[0], color=C.BLUE)
+
+        durations = []
+        for enemy in list(world.enemy_soldiers):
+            if world.defeated:
+                break
+            if enemy in world.enemy_soldiers:
+                start = perf_counter()
+                enemy.hunt()
+                durations.append((perf_counter() - start) * 1000)
+
+        turn_durations.append(sum(durations))
+        hunt_durations.append(max(durations, default=0.0))
+
+    return turn_durations, hunt_durations
+
+
+def report(name: str, turn_durations: list, hunt_durations: list) -> None:
+    # The first turn builds every distance field or cluster graph from scratch.
+    print(
+        f"{name:<28}"
+        f" first turn {turn_durations[0]:9.2f} ms"
+        f"  median turn {statistics.median(turn_durations[1:] or turn_durations):9.2f} ms"
+        f"  slowest hunt {max(hunt_durations):9.2f} ms"
+    )
+
+
+def main() -> None:
+    turns = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    print(f"{ENEMY_COUNT} enemies against {ALLY_COUNT} allies, {turns} turns")
+    for width, height in SIZES:
+        for hierarchical in (False, True):
+            name = f"{width}x{height} {'cluster graph' if hierarchical else 'distance fields'}"
+            report(name, *measure(width, height, hierarchical, turns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+Time the hot paths of the engine across board sizes, unit counts and wall
+densities, and compare the results of two runs to catch regressions:
+the approaching paths of a hunter toward every rival, a single hunt, the
+search for the tiles a soldier can move to when it is pressed, the random
+layout of the landscape (not the composition of its images, which needs a
+display) and a whole computer turn. Every case starts from a freshly
+populated world with the same seed, so the caches are as cold as at the start
+of a wave. No display is required.
+Usage (from the sources directory):
+    python -m benchmarks.suite run [--repeat N] [--output results.json]
+    python -m benchmarks.suite compare baseline.json results.json [--threshold 0.1]
+"""
+
+
+import json
+import platform
+import random
+import statistics
+import sys
+from argparse import ArgumentParser
+from itertools import product
+from time import perf_counter
+
+from game.configuration import Configuration as C
+from game.engine import Simulation, World, units
+
+SIZES = ((21, 13), (64, 64), (128, 128))
+UNIT_COUNTS = (12, 48)
+WALL_DENSITIES = (0.0, 0.15)
+SEED = 0
+GAME_COUNT = 5
+
+
+def populate(width: int, height: int, unit_count: int, wall_density: float) -> World:
+    """
+    Return a world with a barrack guarded by unit_count allies in the middle,
+    unit_count enemies along the edges and walls on wall_density of the tiles.
+    """
+    world = World(width, height, SEED)
+    rng = random.Random(SEED)
+    board = world.board
+    cx, cy = width // 2, height // 2
+
+    units.Barrack(world, cx, cy)
+
+    # Allies fill the tiles nearest to the barrack, enemies the edges, in random order.
+    inner = sorted(
+        ((x, y) for x in range(1, width - 1) for y in range(1, height - 1) if (x, y) != (cx, cy)),
+        key=lambda coordinate: abs(coordinate[0] - cx) + abs(coordinate[1] - cy) + rng.random(),
+    )
+    for x, y in inner[:unit_count]:
+        rng.choice((units.Archer, units.Cavalry, units.Infantry))(world, x, y, color=C.BLUE)
+
+    edges = [(x, y) for x in range(width) for y in range(height) if x in {0, width - 1} or y in {0, height - 1}]
+    for x, y in rng.sample(edges, min(unit_count, len(edges))):
+        rng.choice((units.Archer, units.Cavalry, units.Infantry))(world, x, y, color=C.RED)
+
+    for _ in range(int(width * height * wall_density)):
+        x, y = rng.randrange(width), rng.randrange(height)
+        if board.is_vacant(x, y) and abs(x - cx) + abs(y - cy) > 2:
+            units.Wall(world, x, y)
+
+    # The neighbors of every tile are laid out once per board size, long before any wave arrives.
+    board.get_neighbors(0)
+    board.get_neighbors(1)
+
+    return world
+
+
+def measure(setup, func, repeat: int) -> list:
+    """
+    Return the wall time of every call to func in milliseconds, each made on
+    what a fresh call to setup returns.
+    """
+    durations = []
+    for _ in range(repeat):
+        state = setup()
+        start = perf_counter()
+        func(state)
+        durations.append((perf_counter() - start) * 1000)
+
+    return durations
+
+
+def approach_every_rival(world: World) -> None:
+    hunter = next(iter(world.enemy_soldiers))
+    for other in [*world.allied_soldiers, *world.critical_buildings]:
+        hunter._get_approaching_path(other)
+
+
+def hunt_once(world: World) -> None:
+    next(iter(world.enemy_soldiers)).hunt()
+
+
+def find_movement_targets(world: World) -> None:
+    for ally in world.allied_soldiers:
+        world.reachability.get(ally)
+
+
+def lay_out_landscape(world: World) -> None:
+    world.board.lay_out_landscape(world.rng)
+
+
+def play_computer_turn(world: World) -> None:
+    for enemy in list(world.enemy_soldiers):
+        if world.defeated:
+            break
+        enemy.hunt()
+
+
+def play_games(simulations: list) -> None:
+    for simulation in simulations:
+        simulation.play()
+
+
+def run(repeat: int) -> dict:
+    """
+    Time every case and return the results keyed by case and parameters.
+    """
+    results = {}
+
+    def record(name: str, durations: list) -> None:
+        results[name] = {
+            "median_ms": statistics.median(durations),
+            "min_ms": min(durations),
+            "max_ms": max(durations),
+            "repeat": len(durations),
+        }
+        print(f"{name:<48} median {results[name]['median_ms']:10.3f} ms  min {results[name]['min_ms']:10.3f} ms")
+
+    for width, height in SIZES:
+        record(
+            f"landscape-layout/{width}x{height}",
+            measure(lambda: World(width, height, SEED), lay_out_landscape, repeat),
+        )
+
+    record(
+        f"games/{C.HORIZONTAL_LAND_TILE_COUNT}x{C.VERTICAL_TILE_COUNT}/games={GAME_COUNT}",
+        measure(lambda: [Simulation(seed=seed) for seed in range(SEED, SEED + GAME_COUNT)], play_games, repeat),
+    )
+
+    for (width, height), unit_count, wall_density in product(SIZES, UNIT_COUNTS, WALL_DENSITIES):
+        parameters = f"{width}x{height}/units={unit_count}/walls={wall_density:.2f}"
+
+        def setup() -> World:
+            return populate(width, height, unit_count, wall_density)
+
+        for name, func in (
+            ("approaching_path", approach_every_rival),
+            ("hunt", hunt_once),
+            ("movement_targets", find_movement_targets),
+            ("computer_turn", play_computer_turn),
+        ):
+            record(f"{name}/{parameters}", measure(setup, func, repeat))
+
+    return results
+
+
+def compare(baseline: dict, results: dict, threshold: float) -> bool:
+    """
+    Print how the median of every case has changed since baseline and return
+    whether none of them has slowed down by more than threshold.
+    """
+    passed = True
+    for name in sorted(baseline["results"].keys() & results["results"].keys()):
+        before = baseline["results"][name]["median_ms"]
+        after = results["results"][name]["median_ms"]
+        change = after / before - 1.0 if before else 0.0
+        regressed = change > threshold
+        passed &= not regressed
+        print(f"{name:<48} {before:10.3f} ms -> {after:10.3f} ms  {change:+7.1%}{'  REGRESSED' if regressed else ''}")
+
+    for name in sorted(baseline["results"].keys() ^ results["results"].keys()):
+        print(f"{name:<48} only in {'the baseline' if name in baseline['results'] else 'the results'}")
+
+    return passed
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark the engine of TkTactics.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="time every case")
+    run_parser.add_argument("--repeat", default=5, type=int, help="how many times every case is timed")
+    run_parser.add_argument("--output", help="where to write the results as JSON")
+
+    compare_parser = subparsers.add_parser("compare", help="compare two sets of results")
+    compare_parser.add_argument("baseline", help="the results to compare against")
+    compare_parser.add_argument("results", help="the results to check")
+    compare_parser.add_argument(
+        "--threshold",
+        default=0.1,
+        type=float,
+        help="by how much, as a fraction, a median may grow before it counts as a regression",
+    )
+
+    args = parser.parse_args()
+    match args.command:
+        case "run":
+            output = {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": run(args.repeat),
+            }
+            if args.output:
+                with open(args.output, "w") as file:
+                    json.dump(output, file, indent=2)
+        case "compare":
+            with open(args.baseline) as file:
+                baseline = json.load(file)
+            with open(args.results) as file:
+                results = json.load(file)
+            if not compare(baseline, results, args.threshold):
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
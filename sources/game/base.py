@@ -2,11 +2,13 @@ import tkinter as tk
 from abc import ABC, abstractmethod
 
 from game.miscellaneous import get_pixels
+from game.states import Session
 
 
 class GameObject(ABC):
 
-    def __init__(self, canvas: tk.Canvas, x: int, y: int, *, attach: bool = True) -> None:
+    def __init__(self, session: Session, canvas: tk.Canvas, x: int, y: int, *, attach: bool = True) -> None:
+        self._session = session
         self._canvas = canvas
         self.x = x
         self.y = y
@@ -18,9 +20,16 @@ class GameObject(ABC):
     def detach_and_destroy_widgets(self) -> None:
         if hasattr(self, "_main_widget_id"):
             self.detach_widgets_from_canvas()
+        self._session.redraw_scheduler.discard(self)
         self._unregister()
         self._destroy_widgets()
 
+    def mark_dirty(self) -> None:
+        """
+        Have the widgets refreshed once the event loop is idle.
+        """
+        self._session.redraw_scheduler.mark_dirty(self)
+
     @abstractmethod
     def _create_widgets(self) -> None:
         raise NotImplementedError
@@ -46,12 +55,3 @@ class GameObject(ABC):
     def detach_widgets_from_canvas(self) -> None:
         self._canvas.delete(self._main_widget_id)
         del self._main_widget_id
-
-    def get_distance_between(self, other) -> int:
-        """
-        Return the Manhattan distance between self and other.
-        """
-        if isinstance(other, tuple):
-            return abs(other[0] - self.x) + abs(other[1] - self.y)
-
-        return abs(other.x - self.x) + abs(other.y - self.y)
@@ -1,73 +1,64 @@
 import tkinter as tk
 from abc import abstractmethod
-from tkinter import ttk
 
 from game.base import GameObject
-from game.miscellaneous import Configuration as C
-from game.miscellaneous import Image, get_pixels
-from game.states import GameState
+from game.configuration import Configuration as C
+from game.engine import units
+from game.miscellaneous import Image
+from game.renderers import RENDERER_TYPE_BY_NAME
+from game.states import Session
 
 
-class Building(GameObject):
+class Building(units.Building, GameObject):
 
-    defense = 0.4
-    health = 400.0
+    def __init__(self, session: Session, canvas: tk.Canvas, x: int, y: int, *, attach: bool = True) -> None:
+        units.Building.__init__(self, session.game.world, x, y, register=False)
+        GameObject.__init__(self, session, canvas, x, y, attach=attach)
 
     def _create_widgets(self) -> None:
-        self._main_widget = ttk.Button(
+        self._renderer = RENDERER_TYPE_BY_NAME[self._session.render.renderer](
             self._canvas,
+            maximum_health=self.maximum_health,
             command=self.handle_click_event,
-            cursor="hand2",
-            image=getattr(Image, type(self).__name__.lower()),
-            style="CustomBlue.TButton",
-            takefocus=False,
-        )
-        self.health_bar = ttk.Progressbar(
-            self._canvas,
-            length=C.HEALTH_BAR_LENGTH,
-            maximum=self.health,
-            mode="determinate",
-            orient=tk.HORIZONTAL,
-            style="Green_Red.Horizontal.TProgressbar",
-            value=self.health,
         )
+        self._image = getattr(Image, type(self).__name__.lower())
+        self._renderer.configure(color=C.BLUE, cursor="hand2", image=self._image)
 
     def _destroy_widgets(self) -> None:
-        self.health_bar.destroy()
-        del self.health_bar
-        super()._destroy_widgets()
-
-    @abstractmethod
-    def _register(self) -> None:
-        GameState.occupied_coordinates.add((self.x, self.y))
-
-    @abstractmethod
-    def _unregister(self) -> None:
-        GameState.occupied_coordinates.remove((self.x, self.y))
+        self._renderer.destroy()
+        del self._renderer
 
     def attach_widgets_to_canvas(self) -> None:
-        self._main_widget_id = self._canvas.create_window(
-            *get_pixels(self.x, self.y, y_pixel_shift=5.0),
-            window=self._main_widget,
-        )
-        self._health_bar_id = self._canvas.create_window(
-            *get_pixels(self.x, self.y, y_pixel_shift=-22.5),
-            window=self.health_bar,
-        )
+        self._main_widget_id = self._renderer.attach(self.x, self.y)
 
     def detach_widgets_from_canvas(self) -> None:
-        self._canvas.delete(self._health_bar_id)
-        del self._health_bar_id
-        super().detach_widgets_from_canvas()
+        self._renderer.detach()
+        del self._main_widget_id
+
+    def refresh_widgets(self) -> None:
+        self._renderer.set_health(self.health)
+
+    def take_damage(self, amount: float) -> None:
+        # The row of self is released once self perishes, so its health is read beforehand.
+        health = self.health - amount
+        super().take_damage(amount)
+        if health > 0.0:
+            self.mark_dirty()
+
+    def perish(self) -> None:
+        self.detach_and_destroy_widgets()
 
     def handle_click_event(self) -> None:
-        match GameState.selected_game_objects:
+        if self._session.input_lock.is_locked():
+            return
+
+        match self._session.game.selected_game_objects:
             case []:
                 self._handle_selection()
-                GameState.selected_game_objects.append(self)
+                self._session.game.selected_game_objects.append(self)
             case [Building() as building]:
                 if building is self:
-                    GameState.selected_game_objects.pop()
+                    self._session.game.selected_game_objects.pop()
                     self._handle_deselection()
                 else:
                     building.handle_click_event()
@@ -1,19 +1,8 @@
 from game.buildings.base import Building
-from game.states import BuildingState
+from game.engine import units
 
 
-class Wall(Building):
-
-    defense = 0.5
-    health = 100.0
-
-    def _register(self) -> None:
-        super()._register()
-        BuildingState.noncritical_buildings.add(self)
-
-    def _unregister(self) -> None:
-        super()._unregister()
-        BuildingState.noncritical_buildings.remove(self)
+class Wall(Building, units.Wall):
 
     def _handle_selection(self) -> None:
         pass
@@ -0,0 +1,35 @@
+class Configuration:
+    """
+    A class that manages colors and dimensional settings.
+    """
+
+    BLUE = "#043E6F"
+    GRAY = "#3B3B3B"
+    RED = "#801110"
+    COLOR_NAME_BY_HEX_TRIPLET = {
+        BLUE: "blue",
+        GRAY: "gray",
+        RED: "red",
+    }
+
+    # In milliseconds
+    FRAME_BUDGET = 8
+    # 0 meaning no animation at all
+    ANIMATION_FRAME_DURATION_BY_SPEED = {
+        "fast": 100,
+        "instant": 0,
+        "normal": 400,
+    }
+
+    # In pixels
+    TILE_DIMENSION = 60
+    HEALTH_BAR_LENGTH = 45
+
+    # The default board size, which is also the largest the viewport gets
+    HORIZONTAL_LAND_TILE_COUNT = 21
+    HORIZONTAL_SHORE_TILE_COUNT = 1
+    HORIZONTAL_OCEAN_TILE_COUNT = 2
+    VERTICAL_TILE_COUNT = 13
+    MINIMUM_LAND_TILE_COUNT = 7
+    # Boards with at least this many land tiles are searched with a cluster graph rather than distance fields
+    HIERARCHICAL_PATHFINDING_TILE_COUNT = 10000
@@ -2,20 +2,20 @@ import tkinter as tk
 from tkinter import ttk
 
 from game.base import GameObject
-from game.miscellaneous import Configuration as C
-from game.states import ControlState
+from game.states import Session
 
 
 class DisplayOutcomeControl(GameObject):
 
-    def __init__(self, canvas: tk.Canvas, *, text: str, attach: bool = True) -> None:
-        if ControlState.display_outcome_control:
-            ControlState.display_outcome_control.handle_click_event()
+    def __init__(self, session: Session, canvas: tk.Canvas, *, text: str, attach: bool = True) -> None:
+        if session.control.display_outcome_control:
+            session.control.display_outcome_control.handle_click_event()
 
         self._text = text
-        x = C.HORIZONTAL_LAND_TILE_COUNT // 2
-        y = C.VERTICAL_TILE_COUNT // 2
-        super().__init__(canvas, x, y, attach=attach)
+        x0, y0, x1, y1 = session.view.viewport.get_visible_area()
+        x = (x0 + x1) // 2
+        y = (y0 + y1) // 2
+        super().__init__(session, canvas, x, y, attach=attach)
 
     def _create_widgets(self) -> None:
         self._main_widget = ttk.Button(
@@ -28,10 +28,10 @@ class DisplayOutcomeControl(GameObject):
         )
 
     def _register(self) -> None:
-        ControlState.display_outcome_control = self
+        self._session.control.display_outcome_control = self
 
     def _unregister(self) -> None:
-        ControlState.display_outcome_control = None
+        self._session.control.display_outcome_control = None
 
     def handle_click_event(self) -> None:
         self.detach_and_destroy_widgets()
@@ -1,53 +1,18 @@
-import tkinter as tk
-from collections.abc import Iterator
-from functools import wraps
-from math import ceil
-from random import choice, sample
 from tkinter import ttk
 
 from game.base import GameObject
+from game.configuration import Configuration as C
 from game.controls.display_outcome import DisplayOutcomeControl
-from game.miscellaneous import Configuration as C
-from game.miscellaneous import Environment as E
-from game.miscellaneous import msleep
+from game.highlights import MovementHighlight
 from game.soldiers import Archer, Cavalry, Infantry
-from game.soldiers.base import Soldier
-from game.states import BuildingState, ControlState, DisplayState, GameState, SoldierState
 
-
-def block_user_input_during(func):
-    @wraps(func)
-    def wrapper(self, *args, **kwargs):
-        overlay = tk.Toplevel(self._canvas.master)
-        overlay.wm_geometry(f"{E.SCREEN_WIDTH}x{E.SCREEN_HEIGHT}+0+0")
-
-        match E.WINDOWING_SYSTEM:
-            case "win32":
-                overlay.wm_attributes("-alpha", 0.01, "-disabled", 1, "-topmost", 1)
-                overlay.wm_overrideredirect(True)
-            case "x11":
-                overlay.wm_overrideredirect(True)
-                overlay.wait_visibility()
-                overlay.wm_attributes("-alpha", 0.01, "-topmost", 1)
-
-                # Wait until the overlay becomes transparent.
-                msleep(self._canvas.master, 20)
-
-        value = func(self, *args, **kwargs)
-
-        overlay.destroy()
-
-        return value
-    return wrapper
+SOLDIER_TYPE_BY_NAME = {
+    soldier_type.__name__: soldier_type for soldier_type in (Archer, Cavalry, Infantry)
+}
 
 
 class EndTurnControl(GameObject):
 
-    def __init__(self, canvas: tk.Canvas, x: int, y: int, *, attach: bool = True) -> None:
-        self._day_generator_iterator = self._day_generator_function()
-        self._wave_generator_iterator = self._wave_generator_function()
-        super().__init__(canvas, x, y, attach=attach)
-
     def _create_widgets(self) -> None:
         self._main_widget = ttk.Button(
             self._canvas,
@@ -59,112 +24,127 @@ class EndTurnControl(GameObject):
         )
 
     def _register(self) -> None:
-        ControlState.end_turn_control = self
+        self._session.control.end_turn_control = self
 
     def _unregister(self) -> None:
-        ControlState.end_turn_control = None
+        self._session.control.end_turn_control = None
 
-    @block_user_input_during
     def handle_click_event(self) -> None:
-        for obj in GameState.selected_game_objects[::-1]:
-            obj.handle_click_event()
-
-        if SoldierState.enemy_soldiers:
-            for enemy in SoldierState.enemy_soldiers:
-                enemy.attacked_this_turn = False
-                enemy.moved_this_turn = False
-                enemy.refresh_widgets()
-
-            self._execute_computer_turn()
-        else:
-            next(self._day_generator_iterator)
-
-        for ally in SoldierState.allied_soldiers:
-            ally.attacked_this_turn = False
-            ally.moved_this_turn = False
-            ally.refresh_widgets()
-
-    def _execute_computer_turn(self) -> None:
-        if not SoldierState.allied_soldiers and not BuildingState.critical_buildings:
-            DisplayOutcomeControl(self._canvas, text="You have been defeated.")
+        if self._session.input_lock.is_locked():
             return
 
-        for enemy in SoldierState.enemy_soldiers:
-            enemy.hunt()
+        for obj in self._session.game.selected_game_objects[::-1]:
+            obj.handle_click_event()
 
-            if not SoldierState.allied_soldiers and not BuildingState.critical_buildings:
-                DisplayOutcomeControl(self._canvas, text="You have been defeated.")
+        self._session.game.world.action_log.record_end_turn()
+        self._session.input_lock.acquire()
+        self._session.scheduler.spawn(self._play_turn())
+
+    def _play_turn(self):
+        """
+        Play the computer's turn, or advance the day if there is no enemy left,
+        as a task of the scheduler.
+        """
+        world = self._session.game.world
+        profiler = self._session.profiler
+
+        profiler.start_turn()
+        try:
+            paths = []
+            if world.enemy_soldiers:
+                with profiler.phase("reset enemies"):
+                    world.unit_store.reset_turn(world.enemy_soldiers)
+                    for enemy in world.enemy_soldiers:
+                        enemy.mark_dirty()
+
+                paths = yield from self._execute_computer_turn()
+            else:
+                self._advance_day()
+
+            yield from self._replay(paths)
+
+            with profiler.phase("refresh allies"):
+                world.unit_store.reset_turn(world.allied_soldiers)
+                for ally in world.allied_soldiers:
+                    ally.mark_dirty()
+
+            with profiler.phase("reachability"):
+                world.reachability.refresh(world.allied_soldiers | world.enemy_soldiers)
+
+            # Redrawn now rather than once idle, so that the turn accounts for the calls to Tk it causes.
+            with profiler.phase("redraw"):
+                self._session.redraw_scheduler.flush()
+        finally:
+            self._session.input_lock.release()
+            profiler.end_turn()
+
+    def _execute_computer_turn(self):
+        """
+        Let every enemy hunt without any animation, yielding after each of them.
+        Return the paths they have taken.
+        """
+        world = self._session.game.world
+        viewport = self._session.view.viewport
+        profiler = self._session.profiler
+
+        if world.defeated:
+            DisplayOutcomeControl(self._session, viewport.canvas, text="You have been defeated.")
+            return []
+
+        paths = []
+        for enemy in list(world.enemy_soldiers):
+            with profiler.phase(f"hunt by {type(enemy).__name__.lower()}"):
+                paths.append(enemy.hunt())
+            with profiler.phase("viewport"):
+                viewport.refresh_units()
+
+            if world.defeated:
+                DisplayOutcomeControl(self._session, viewport.canvas, text="You have been defeated.")
                 break
 
-    def _day_generator_function(self) -> Iterator[None]:
-        while True:
-            GameState.day += 1
-            if DisplayState.day_display:
-                DisplayState.day_display.refresh_widgets()
-            for ally in SoldierState.allied_soldiers:
-                ally.restore_health_by(10.0)
             yield
 
-            GameState.day += 1
-            if DisplayState.day_display:
-                DisplayState.day_display.refresh_widgets()
-            try:
-                next(self._wave_generator_iterator)
-                yield
-            except StopIteration:
-                while True:
-                    DisplayOutcomeControl(self._canvas, text="Victory is yours!")
-                    yield
-
-            GameState.day += 1
-            if DisplayState.day_display:
-                DisplayState.day_display.refresh_widgets()
-            GameState.coin += 8 + (GameState.wave * 2)
-            if DisplayState.coin_display:
-                DisplayState.coin_display.refresh_widgets()
-            for ally in SoldierState.allied_soldiers:
-                ally.restore_health_by(10.0)
-            yield
+        return paths
+
+    def _advance_day(self) -> None:
+        world = self._session.game.world
+        viewport = self._session.view.viewport
+        profiler = self._session.profiler
+
+        with profiler.phase("advance day"):
+            arrivals = world.advance_day()
+        with profiler.phase("spawn wave"):
+            for name, x, y in arrivals:
+                SOLDIER_TYPE_BY_NAME[name](self._session, viewport.canvas, x, y, color=C.RED)
+        with profiler.phase("viewport"):
+            viewport.refresh_units()
+
+        if world.victorious:
+            DisplayOutcomeControl(self._session, viewport.canvas, text="Victory is yours!")
+
+        if self._session.display.day_display:
+            self._session.display.day_display.mark_dirty()
+        if self._session.display.coin_display:
+            self._session.display.coin_display.mark_dirty()
+
+    def _replay(self, paths: list):
+        """
+        Show the paths of the computer turn as one batched animation frame.
+        """
+        duration = C.ANIMATION_FRAME_DURATION_BY_SPEED[self._session.animation.speed]
+        if not duration or not paths:
+            return
 
-    def _wave_generator_function(self) -> Iterator[None]:
-        H = C.HORIZONTAL_LAND_TILE_COUNT
-        V = C.VERTICAL_TILE_COUNT
-        area_north_east = [
-            *[(x, 0) for x in range(H - 3, H - 1)],     #     2
-            *[(H - 1, y) for y in range(6)],            #     ▔▕ 6
-        ]
-        area_north_west = [
-            *[(x, 0) for x in range(1, 3)],             #    2
-            *[(0, y) for y in range(6)],                # 6▕ ▔
-        ]
-        area_south_east = [
-            *[(H - 1, y) for y in range(V - 6, V)],     #     ▁▕ 6
-            *[(x, V - 1) for x in range(H - 3, H - 1)], #     2
+        highlights = [
+            MovementHighlight.acquire(self._session, self._session.view.viewport.canvas, *coordinate)
+            for coordinate in {coordinate for path in paths for coordinate in path[:-1]}
         ]
-        area_south_west = [
-            *[(0, y) for y in range(V - 6, V)],         # 6▕ ▁
-            *[(x, V - 1) for x in range(1, 3)],         #    2
-        ]
-
-        def sample_n_coordinates_from_m_areas(n: int, m: int) -> list:
-            coordinates = []
-            for area in sample([area_north_east, area_north_west, area_south_east, area_south_west], m):
-                coordinates.extend(area)
-            return sample(coordinates, n)
 
-        def sample_common_soldiers() -> Soldier:
-            return choice([Archer, Cavalry, Infantry])
+        if self._session.control.display_outcome_control:
+            self._session.control.display_outcome_control._main_widget.lift()
 
-        common_soldiers = {Archer, Cavalry, Infantry}
-        while common_soldiers:
-            GameState.wave += 1
-            [(x, y)] = sample_n_coordinates_from_m_areas(1, 1)
-            common_soldiers.pop()(self._canvas, x, y, color=C.RED)
-            yield
-
-        for n in range(2, 18 + 1, 2):
-            m = ceil(n / 6)
-            GameState.wave += 1
-            for x, y in sample_n_coordinates_from_m_areas(n, m):
-                sample_common_soldiers()(self._canvas, x, y, color=C.RED)
-            yield
+        try:
+            yield duration
+        finally:
+            for highlight in highlights:
+                highlight.release()
@@ -1,3 +1,4 @@
 from game.displays.coin import CoinDisplay
 from game.displays.day import DayDisplay
+from game.displays.latency import LatencyDisplay
 from game.displays.stat import StatDisplay
@@ -12,8 +12,14 @@ class Display(GameObject):
             cursor="arrow",
             style="SmallText.Black_Burlywood4.TButton",
         )
+        self._text = None
         self.refresh_widgets()
 
     @abstractmethod
     def refresh_widgets(self) -> None:
         raise NotImplementedError
+
+    def _set_text(self, text: str) -> None:
+        if text != self._text:
+            self._main_widget.configure(text=text)
+            self._text = text
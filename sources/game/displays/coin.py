@@ -1,14 +1,13 @@
 from game.displays.base import Display
-from game.states import DisplayState, GameState
 
 
 class CoinDisplay(Display):
 
     def _register(self) -> None:
-        DisplayState.coin_display = self
+        self._session.display.coin_display = self
 
     def _unregister(self) -> None:
-        DisplayState.coin_display = None
+        self._session.display.coin_display = None
 
     def refresh_widgets(self) -> None:
-        self._main_widget.configure(text=f"Coin: {GameState.coin:3d}")
+        self._set_text(f"Coin: {self._session.game.world.coin:3d}")
@@ -1,14 +1,13 @@
 from game.displays.base import Display
-from game.states import DisplayState, GameState
 
 
 class DayDisplay(Display):
 
     def _register(self) -> None:
-        DisplayState.day_display = self
+        self._session.display.day_display = self
 
     def _unregister(self) -> None:
-        DisplayState.day_display = None
+        self._session.display.day_display = None
 
     def refresh_widgets(self) -> None:
-        self._main_widget.configure(text=f"Day:  {GameState.day:3d}")
+        self._set_text(f"Day:  {self._session.game.world.day:3d}")
@@ -0,0 +1,18 @@
+from game.displays.base import Display
+from game.monitor import LatencyMonitor
+
+
+class LatencyDisplay(Display):
+
+    def _register(self) -> None:
+        LatencyMonitor.displays.add(self)
+
+    def _unregister(self) -> None:
+        LatencyMonitor.displays.discard(self)
+
+    def refresh_widgets(self) -> None:
+        self._set_text(
+            f"P50: {LatencyMonitor.get_percentile(50):4d}\n"
+            f"P99: {LatencyMonitor.get_percentile(99):4d}\n"
+            f"MAX: {LatencyMonitor.longest_lag:4d}"
+        )
@@ -1,19 +1,18 @@
 from textwrap import dedent
 
 from game.displays.base import Display
-from game.states import DisplayState, GameState
 
 
 class StatDisplay(Display):
 
     def _register(self) -> None:
-        DisplayState.stat_display = self
+        self._session.display.stat_display = self
 
     def _unregister(self) -> None:
-        DisplayState.stat_display = None
+        self._session.display.stat_display = None
 
     def refresh_widgets(self) -> None:
-        if pressed := GameState.pressed_game_object:
+        if pressed := self._session.game.pressed_game_object:
             text = dedent(
                 f"""\
                 {type(pressed).__name__}
@@ -33,4 +32,4 @@ class StatDisplay(Display):
         else:
             text = "\n" * 11
 
-        self._main_widget.configure(text=text)
+        self._set_text(text)
@@ -0,0 +1,2 @@
+from game.engine.simulation import Simulation
+from game.engine.world import World
@@ -0,0 +1,95 @@
+GRASS = 0
+ROCK = 1
+TREE = 2
+
+# Fifteen kinds of grass, then rock and tree, each with how often it is laid out.
+LAND_TERRAINS = (*(GRASS for _ in range(15)), ROCK, TREE)
+LAND_WEIGHTS = (56, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 15, 15)
+TERRAIN_BY_LAND = bytes(LAND_TERRAINS).ljust(256, bytes([GRASS]))
+
+
+class Board:
+    """
+    A class that lays the land tiles of a world out in flat arrays.
+    Tiles are addressed by their flat index y * width + x.
+    """
+
+    # Neighbors only depend on the size of a board, so every game of a process shares them.
+    _neighbors_by_shape = {}
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.occupancy = bytearray(width * height)
+        self.terrain = bytearray(width * height)
+        # Which of the kinds of land every tile shows
+        self.lands = bytearray(width * height)
+        self.version = 0
+        self._entities = [None] * (width * height)
+
+    def lay_out_landscape(self, rng) -> None:
+        """
+        Draw the land of every tile with rng.
+        """
+        self.set_lands(bytes(rng.choices(range(len(LAND_WEIGHTS)), weights=LAND_WEIGHTS, k=len(self.lands))))
+
+    def set_lands(self, lands: bytes) -> None:
+        self.lands[:] = lands
+        self.terrain[:] = self.lands.translate(TERRAIN_BY_LAND)
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def contains(self, x: int, y: int, margin: int = 0) -> bool:
+        """
+        Return whether (x, y) lies on the board, at least margin tiles away from its edge.
+        """
+        return margin <= x < self.width - margin and margin <= y < self.height - margin
+
+    def get_neighbors(self, margin: int = 0) -> tuple:
+        """
+        Return, for every tile, the flat indices of its orthogonal neighbors that
+        lie at least margin tiles away from the edge of the board.
+        """
+        shape = (self.width, self.height, margin)
+        if shape not in self._neighbors_by_shape:
+            self._neighbors_by_shape[shape] = tuple(
+                tuple(
+                    ny * self.width + nx
+                    for nx, ny in ((x + 1, y), (x, y + 1), (x - 1, y), (x, y - 1))
+                    if self.contains(nx, ny, margin)
+                )
+                for y in range(self.height)
+                for x in range(self.width)
+            )
+
+        return self._neighbors_by_shape[shape]
+
+    def is_vacant(self, x: int, y: int) -> bool:
+        return not self.occupancy[y * self.width + x]
+
+    def get_entity_at(self, x: int, y: int):
+        """
+        Return whatever stands on (x, y), or None if the tile is vacant.
+        """
+        return self._entities[y * self.width + x]
+
+    def place(self, entity) -> int:
+        """
+        Put entity onto the tile it claims to stand on and return the tile's flat index.
+        """
+        i = entity.y * self.width + entity.x
+        self.occupancy[i] = 1
+        self._entities[i] = entity
+        self.version += 1
+        return i
+
+    def remove(self, entity) -> int:
+        """
+        Take entity off the tile it claims to stand on and return the tile's flat index.
+        """
+        i = entity.y * self.width + entity.x
+        self.occupancy[i] = 0
+        self._entities[i] = None
+        self.version += 1
+        return i
@@ -0,0 +1,194 @@
+import itertools
+from collections import deque
+
+
+class ConnectedComponents:
+    """
+    A labelling of the vacant tiles of a board by connected component, for
+    soldiers that keep margin tiles away from its edge. Labels are repaired
+    locally whenever a tile is occupied or vacated, so whether a tile can be
+    reached from another is answered by comparing two labels.
+    """
+
+    def __init__(self, board, margin: int) -> None:
+        self._board = board
+        self._width = board.width
+        self._margin = margin
+        self._blocked = board.occupancy
+        self._neighbors = board.get_neighbors(margin)
+        self._new_label = itertools.count(1)
+
+        # 0 for tiles that are occupied or too close to the edge of the board
+        self.labels = [0] * len(self._blocked)
+        self._sizes_by_label = {}
+        for i in range(len(self.labels)):
+            if not self.labels[i] and self._is_passable(i):
+                label = next(self._new_label)
+                self._sizes_by_label[label] = self._fill(i, label)
+
+    def _is_passable(self, i: int) -> bool:
+        return self._board.contains(i % self._width, i // self._width, self._margin) and not self._blocked[i]
+
+    def _fill(self, i: int, label: int) -> int:
+        """
+        Label the component of tile i with label and return its size.
+        """
+        labels = self.labels
+        old_label = labels[i]
+        labels[i] = label
+        size = 1
+        queue = deque([i])
+        while queue:
+            j = queue.popleft()
+            for k in self._neighbors[j]:
+                if labels[k] == old_label and labels[k] != label and not self._blocked[k]:
+                    labels[k] = label
+                    size += 1
+                    queue.append(k)
+
+        return size
+
+    def get_approaching_radius(self, x: int, y: int, target, radius: int) -> int:
+        """
+        Return the smallest radius, no smaller than radius, within which a soldier
+        standing on (x, y) can get to target. The tile (x, y) itself may be
+        occupied by that soldier, who can always stay where it is.
+        """
+        width = self._width
+        reachable_labels = {self.labels[i] for i in self._neighbors[y * width + x]} - {0}
+        distance = abs(x - target.x) + abs(y - target.y)
+        if not reachable_labels:
+            return max(distance, radius)
+
+        for r in range(distance):
+            for dx in range(-r, r + 1):
+                for dy in {r - abs(dx), abs(dx) - r}:
+                    tx, ty = target.x + dx, target.y + dy
+                    if self._board.contains(tx, ty) and self.labels[ty * width + tx] in reachable_labels:
+                        return max(r, radius)
+
+        return max(distance, radius)
+
+    def block(self, i: int) -> None:
+        """
+        Repair the labels after tile i has been occupied.
+        """
+        label = self.labels[i]
+        if not label:
+            return
+
+        self.labels[i] = 0
+        self._sizes_by_label[label] -= 1
+
+        sources = [j for j in self._neighbors[i] if self.labels[j] == label]
+        if len(sources) <= 1:
+            if not self._sizes_by_label[label]:
+                del self._sizes_by_label[label]
+            return
+
+        # Nothing is split off when the neighbors are still linked through the corners
+        # around tile i, which is the common case in the open.
+        linked = {sources[0]}
+        while True:
+            corner_linked = {
+                j for j in sources
+                if j not in linked and any(j + k != 2 * i and self.labels[j + k - i] == label for k in linked)
+            }
+            if not corner_linked:
+                break
+            linked |= corner_linked
+
+        if len(linked) == len(sources):
+            return
+
+        # Search from every neighbor in turns. A search that runs out of tiles before
+        # meeting any other has found a component split off by tile i, so only the
+        # smaller parts get visited and relabelled.
+        roots = list(range(len(sources)))
+        owners = {j: k for k, j in enumerate(sources)}
+        visited = [[j] for j in sources]
+        queues = [deque([j]) for j in sources]
+        active = set(roots)
+
+        def find(k: int) -> int:
+            while roots[k] != k:
+                k = roots[k]
+            return k
+
+        while len(active) > 1:
+            for k in list(active):
+                if k not in active:
+                    continue
+
+                if not queues[k]:
+                    active.remove(k)
+                    new_label = next(self._new_label)
+                    for j in visited[k]:
+                        self.labels[j] = new_label
+                    self._sizes_by_label[new_label] = len(visited[k])
+                    self._sizes_by_label[label] -= len(visited[k])
+                    if len(active) == 1:
+                        break
+                    continue
+
+                j = queues[k].popleft()
+                for m in self._neighbors[j]:
+                    if self.labels[m] != label or self._blocked[m]:
+                        continue
+
+                    if m not in owners:
+                        owners[m] = k
+                        visited[k].append(m)
+                        queues[k].append(m)
+                    elif (other := find(owners[m])) != k:
+                        roots[other] = k
+                        visited[k] += visited[other]
+                        queues[k] += queues[other]
+                        active.discard(other)
+
+    def unblock(self, i: int) -> None:
+        """
+        Repair the labels after tile i has been vacated.
+        """
+        if not self._is_passable(i):
+            return
+
+        labels = {self.labels[j] for j in self._neighbors[i]} - {0}
+        if not labels:
+            label = next(self._new_label)
+            self.labels[i] = label
+            self._sizes_by_label[label] = 1
+            return
+
+        # Merge the smaller components into the largest one.
+        label = max(labels, key=self._sizes_by_label.get)
+        self.labels[i] = label
+        self._sizes_by_label[label] += 1
+        for other in labels - {label}:
+            j = next(j for j in self._neighbors[i] if self.labels[j] == other)
+            self._sizes_by_label[label] += self._fill(j, label)
+            del self._sizes_by_label[other]
+
+
+class ConnectedComponentsCache:
+    """
+    A class that keeps one labelling per margin and repairs them as tiles of
+    board are occupied or vacated.
+    """
+
+    def __init__(self, board) -> None:
+        self.board = board
+        self._components_by_margin = {}
+
+    def get(self, margin: int) -> ConnectedComponents:
+        if margin not in self._components_by_margin:
+            self._components_by_margin[margin] = ConnectedComponents(self.board, margin)
+        return self._components_by_margin[margin]
+
+    def block(self, i: int) -> None:
+        for components in self._components_by_margin.values():
+            components.block(i)
+
+    def unblock(self, i: int) -> None:
+        for components in self._components_by_margin.values():
+            components.unblock(i)
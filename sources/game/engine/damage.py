@@ -0,0 +1,66 @@
+class DamageTable:
+    """
+    A class that precomputes the attack and defense of every unit type at every
+    level from the class attributes of those types, along with the damage each
+    of them deals to every other. Units carry the compact index of their type
+    and level into the table, which only changes when they are promoted.
+    """
+
+    # How much stronger a unit gets with every level
+    ATTACK_GROWTH = 1.2
+    DEFENSE_GROWTH = 0.05
+
+    def __init__(self, unit_types: tuple, level_count: int) -> None:
+        self._level_count = level_count
+        self._type_id_by_name = {unit_type.__name__: i for i, unit_type in enumerate(unit_types)}
+
+        self.attacks = []
+        self.defenses = []
+        for unit_type in unit_types:
+            attack = getattr(unit_type, "attack", 0.0)
+            defense = unit_type.defense
+            for _ in range(level_count):
+                self.attacks.append(attack)
+                self.defenses.append(defense)
+                attack *= self.ATTACK_GROWTH
+                defense += self.DEFENSE_GROWTH
+
+        self.stride = len(self.attacks)
+        self.damages = [
+            self.attacks[i]
+            * getattr(unit_types[i // level_count], "attack_multipliers", {}).get(unit_types[j // level_count].__name__, 1.0)
+            * (1.0 - self.defenses[j])
+            for i in range(self.stride)
+            for j in range(self.stride)
+        ]
+
+    def get_index(self, type_name: str, level: int) -> int:
+        return self._type_id_by_name[type_name] * self._level_count + level - 1
+
+    def get_damage(self, attacker, target) -> float:
+        return self.damages[attacker.damage_index * self.stride + target.damage_index]
+
+    def get_row(self, attacker) -> list:
+        """
+        Return the damage attacker deals to every unit, indexed by their damage index.
+        """
+        start = attacker.damage_index * self.stride
+        return self.damages[start:start + self.stride]
+
+
+class Stat:
+    """
+    A descriptor that reads the attack or defense of a unit from the damage table
+    by the unit's damage index. Read from a class, it is the value at the first level.
+    """
+
+    def __init__(self, default: float) -> None:
+        self.default = default
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, unit, owner=None) -> float:
+        if unit is None:
+            return self.default
+        return getattr(unit.damage_table, f"{self.name}s")[unit.damage_index]
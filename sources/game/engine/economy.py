@@ -0,0 +1,23 @@
+HEALTH_RESTORED_PER_REST = 10.0
+
+
+def pay_allowance(world) -> None:
+    """
+    Pay the player the allowance earned by surviving the waves so far.
+    """
+    world.coin += 8 + (world.wave * 2)
+
+
+def restore_allied_health(world) -> None:
+    world.unit_store.restore_health(world.allied_soldiers, HEALTH_RESTORED_PER_REST)
+
+
+def can_afford(world, soldier_type) -> bool:
+    return world.coin >= soldier_type.cost
+
+
+def charge_for(world, soldier_type) -> None:
+    """
+    Deduct the cost of recruiting soldier_type from the player's coins.
+    """
+    world.coin -= soldier_type.cost
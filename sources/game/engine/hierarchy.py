@@ -0,0 +1,405 @@
+import heapq
+import itertools
+from collections import deque
+
+from game.engine.pathfinding import INFINITY
+
+GOAL = -1
+
+
+class ClusterGraph:
+    """
+    An HPA*-style abstraction of the vacant tiles of a board for soldiers that
+    keep margin tiles away from its edge. The board is cut into square clusters,
+    adjacent clusters are linked through entrances on their shared border, and
+    the distances between the entrances of every cluster are cached.
+    Occupying or vacating a tile only invalidates the cluster it lies in and
+    the borders it shares with the clusters around.
+    """
+
+    CLUSTER_TILE_COUNT = 8
+    # Runs of open border at least this long get an entrance at both ends instead of one in the middle.
+    LONG_ENTRANCE_LENGTH = 6
+
+    def __init__(self, board, margin: int) -> None:
+        self._board = board
+        self._width = board.width
+        self._height = board.height
+        self._margin = margin
+        self._blocked = board.occupancy
+        self._neighbors = board.get_neighbors(margin)
+
+        n = self.CLUSTER_TILE_COUNT
+        self._cluster_column_count = (self._width + n - 1) // n
+        self._cluster_row_count = (self._height + n - 1) // n
+        cluster_count = self._cluster_column_count * self._cluster_row_count
+
+        self._cluster_by_tile = [
+            (y // n) * self._cluster_column_count + x // n
+            for y in range(self._height)
+            for x in range(self._width)
+        ]
+        self._tiles_by_cluster = [[] for _ in range(cluster_count)]
+        for i, cluster in enumerate(self._cluster_by_tile):
+            self._tiles_by_cluster[cluster].append(i)
+
+        # A cluster maps to the edges of its entrances, {node: {other node: cost}},
+        # leading to the other entrances of the cluster and across the border, or None until it is built.
+        self._graph_by_cluster = [None] * cluster_count
+        self._components_by_cluster = [None] * cluster_count
+        self._entrances_by_border = {}
+
+    def invalidate(self, i: int) -> None:
+        """
+        Forget what depends on tile i after it has been occupied or vacated.
+        """
+        cluster = self._cluster_by_tile[i]
+        self._graph_by_cluster[cluster] = None
+        self._components_by_cluster[cluster] = None
+
+        # Entrances depend on how the tiles along a border are connected inside their clusters.
+        for other in self._get_adjacent_clusters(cluster):
+            self._graph_by_cluster[other] = None
+            self._entrances_by_border.pop((min(cluster, other), max(cluster, other)), None)
+
+    def get_path_from(self, x: int, y: int, target, radius: int, steps: int) -> tuple:
+        """
+        Search the cluster graph for a path from (x, y) to the nearest tile within
+        radius of target, refine it into tiles for at most steps moves and return it.
+        Targets near enough to be reached without leaving the clusters around (x, y)
+        are searched for on the tiles themselves, as paths through entrances detour.
+        The tile (x, y) itself may be occupied by the soldier searching.
+        """
+        width = self._width
+        start = y * width + x
+        if abs(x - target.x) + abs(y - target.y) <= radius:
+            return ((x, y),)
+
+        goals = []
+        for dy in range(-radius, radius + 1):
+            span = radius - abs(dy)
+            for dx in range(-span, span + 1):
+                gx, gy = target.x + dx, target.y + dy
+                if self._board.contains(gx, gy, self._margin) and not self._blocked[gy * width + gx]:
+                    goals.append(gy * width + gx)
+
+        if not goals:
+            return ((x, y),)
+
+        goal_set = set(goals)
+        nearby = self._get_nearby_clusters(start)
+        if any(self._cluster_by_tile[i] in nearby for i in goals):
+            path = self._search_nearby(start, goal_set, target.x, target.y, radius, nearby)
+            if path is not None:
+                return tuple((i % width, i // width) for i in path[:steps + 1])
+
+        exit_costs = {}
+        for cluster in {self._cluster_by_tile[i] for i in goals}:
+            costs, _ = self._search_cluster(cluster, [i for i in goals if self._cluster_by_tile[i] == cluster])
+            for node in self._get_cluster_graph(cluster):
+                if node in costs and costs[node] < exit_costs.get(node, INFINITY):
+                    exit_costs[node] = costs[node]
+
+        target_x, target_y = target.x, target.y
+        costs_by_node = {start: 0}
+        parent_by_node = {}
+        counter = itertools.count()
+        # Entries are ordered by estimated total cost, then deepest first among ties.
+        heap = []
+
+        def relax(node: int, cost: int, parent: int) -> None:
+            if cost < costs_by_node.get(node, INFINITY):
+                costs_by_node[node] = cost
+                parent_by_node[node] = parent
+                heapq.heappush(heap, (cost, -cost, next(counter), node))
+
+        # The start tile is never an entrance as it is occupied, so the search begins
+        # from it and from its neighbors across a border, if any.
+        for seed in (start, *self._neighbors[start]):
+            cluster = self._cluster_by_tile[seed]
+            if seed != start:
+                if self._blocked[seed] or cluster == self._cluster_by_tile[start]:
+                    continue
+                relax(seed, 1, start)
+
+            seed_costs, _ = self._search_cluster(cluster, [seed])
+            for node in self._get_cluster_graph(cluster):
+                if node in seed_costs:
+                    relax(node, costs_by_node[seed] + seed_costs[node], seed)
+            for i in goal_set.intersection(seed_costs):
+                relax(GOAL, costs_by_node[seed] + seed_costs[i], seed)
+
+        # This loop runs for every rival of every hunter, hence the inlined relaxation.
+        cluster_by_tile = self._cluster_by_tile
+        graph_by_cluster = self._graph_by_cluster
+        while heap:
+            _, cost, _, node = heapq.heappop(heap)
+            cost = -cost
+            if node == GOAL:
+                break
+            if cost > costs_by_node[node]:
+                continue
+
+            if node in exit_costs:
+                relax(GOAL, cost + exit_costs[node], node)
+
+            edges = graph_by_cluster[cluster_by_tile[node]]
+            if edges is None:
+                edges = self._get_cluster_graph(cluster_by_tile[node])
+
+            # A seed that is no entrance has no edges as it has already been searched from.
+            for other, edge_cost in edges.get(node, {}).items():
+                other_cost = cost + edge_cost
+                if other_cost < costs_by_node.get(other, INFINITY):
+                    costs_by_node[other] = other_cost
+                    parent_by_node[other] = node
+                    estimate = abs(other % width - target_x) + abs(other // width - target_y) - radius
+                    heapq.heappush(heap, (other_cost + max(estimate, 0), -other_cost, next(counter), other))
+        else:
+            return ((x, y),)
+
+        nodes = [GOAL]
+        while nodes[-1] != start:
+            nodes.append(parent_by_node[nodes[-1]])
+        nodes.reverse()
+
+        # Entrances are few, so the part of the path inside the nearby clusters is
+        # straightened on the tiles themselves, up to the last entrance it passes there.
+        path = [start]
+        for k in range(len(nodes) - 2, 0, -1):
+            if self._cluster_by_tile[nodes[k]] in nearby:
+                waypoint = nodes[k]
+                prefix = self._search_nearby(start, {waypoint}, waypoint % width, waypoint // width, 0, nearby)
+                if prefix and prefix[-1] == waypoint:
+                    path = prefix
+                    nodes = nodes[k:]
+                break
+
+        for a, b in itertools.pairwise(nodes):
+            if len(path) > steps:
+                break
+            if b != GOAL and self._cluster_by_tile[a] != self._cluster_by_tile[b]:
+                path.append(b)
+            else:
+                path.extend(self._refine(a, goal_set if b == GOAL else {b}))
+
+        return tuple((i % width, i // width) for i in path[:steps + 1])
+
+    def _get_nearby_clusters(self, i: int) -> set:
+        """
+        Return the cluster of tile i and the eight clusters around it.
+        """
+        column_count = self._cluster_column_count
+        column, row = self._cluster_by_tile[i] % column_count, self._cluster_by_tile[i] // column_count
+        return {
+            y * column_count + x
+            for y in range(max(row - 1, 0), min(row + 2, self._cluster_row_count))
+            for x in range(max(column - 1, 0), min(column + 2, column_count))
+        }
+
+    def _search_nearby(self, start: int, goals: set, goal_x: int, goal_y: int, radius: int, nearby: set) -> list | None:
+        """
+        Search A* through the tiles of nearby clusters for a shortest path from start
+        to the nearest of goals, which lie within radius of (goal_x, goal_y), and
+        return its tiles. Return None if a path leaving those clusters might be shorter.
+        """
+        width = self._width
+        blocked = self._blocked
+        neighbors = self._neighbors
+        cluster_by_tile = self._cluster_by_tile
+
+        cost_by_tile = {start: 0}
+        parent_by_tile = {start: None}
+        # The estimate is a lower bound of the remaining cost, so no path that leaves the
+        # nearby clusters costs less than the lowest estimate of the tiles it would leave to.
+        bound = INFINITY
+        # Entries are ordered by estimated total cost, then deepest first among ties.
+        heap = [(0, 0, start)]
+        while heap:
+            estimate, cost, i = heapq.heappop(heap)
+            cost = -cost
+            if estimate > bound:
+                return None
+            if cost > cost_by_tile[i]:
+                continue
+
+            if i in goals:
+                tiles = []
+                while i is not None:
+                    tiles.append(i)
+                    i = parent_by_tile[i]
+                return tiles[::-1]
+
+            new_cost = cost + 1
+            for j in neighbors[i]:
+                if blocked[j] or new_cost >= cost_by_tile.get(j, INFINITY):
+                    continue
+                y, x = divmod(j, width)
+                remaining = abs(x - goal_x) + abs(y - goal_y) - radius
+                estimate = new_cost + remaining if remaining > 0 else new_cost
+                if cluster_by_tile[j] not in nearby:
+                    if estimate < bound:
+                        bound = estimate
+                else:
+                    cost_by_tile[j] = new_cost
+                    parent_by_tile[j] = i
+                    heapq.heappush(heap, (estimate, -new_cost, j))
+
+        # Without a way out of the nearby clusters, the goals cannot be reached at all.
+        return [start] if bound == INFINITY else None
+
+    def _refine(self, source: int, destinations: set) -> list:
+        """
+        Return the tiles of a shortest path inside the cluster of source from
+        source to the nearest of destinations, excluding source itself.
+        """
+        cost_by_tile, parent_by_tile = self._search_cluster(self._cluster_by_tile[source], [source], destinations)
+        i = min((i for i in destinations if i in cost_by_tile), key=cost_by_tile.get)
+
+        tiles = []
+        while i != source:
+            tiles.append(i)
+            i = parent_by_tile[i]
+
+        return tiles[::-1]
+
+    def _search_cluster(self, cluster: int, sources: list, destinations: set = frozenset()) -> tuple:
+        """
+        Search breadth first from sources through the vacant tiles of cluster,
+        stopping early once any of destinations is reached.
+        Return the cost and the parent of every tile visited.
+        """
+        cluster_by_tile = self._cluster_by_tile
+        blocked = self._blocked
+        neighbors = self._neighbors
+
+        cost_by_tile = dict.fromkeys(sources, 0)
+        parent_by_tile = dict.fromkeys(sources)
+        queue = deque(sources)
+        while queue:
+            i = queue.popleft()
+            if i in destinations:
+                break
+
+            for j in neighbors[i]:
+                if j not in cost_by_tile and not blocked[j] and cluster_by_tile[j] == cluster:
+                    cost_by_tile[j] = cost_by_tile[i] + 1
+                    parent_by_tile[j] = i
+                    queue.append(j)
+
+        return cost_by_tile, parent_by_tile
+
+    def _get_cluster_graph(self, cluster: int) -> dict:
+        if self._graph_by_cluster[cluster] is None:
+            self._graph_by_cluster[cluster] = self._build_cluster_graph(cluster)
+        return self._graph_by_cluster[cluster]
+
+    def _get_adjacent_clusters(self, cluster: int) -> list:
+        column, row = cluster % self._cluster_column_count, cluster // self._cluster_column_count
+        return [
+            y * self._cluster_column_count + x
+            for x, y in ((column + 1, row), (column, row + 1), (column - 1, row), (column, row - 1))
+            if 0 <= x < self._cluster_column_count and 0 <= y < self._cluster_row_count
+        ]
+
+    def _get_components(self, cluster: int) -> dict:
+        """
+        Label the vacant tiles of cluster by which of them are connected inside it.
+        """
+        if self._components_by_cluster[cluster] is None:
+            components = {}
+            for i in self._tiles_by_cluster[cluster]:
+                if i not in components and not self._blocked[i] and self._board.contains(i % self._width, i // self._width, self._margin):
+                    costs, _ = self._search_cluster(cluster, [i])
+                    components.update(dict.fromkeys(costs, i))
+            self._components_by_cluster[cluster] = components
+
+        return self._components_by_cluster[cluster]
+
+    def _build_cluster_graph(self, cluster: int) -> dict:
+        links = {}
+        for other in self._get_adjacent_clusters(cluster):
+            for i, j in self._get_entrances(min(cluster, other), max(cluster, other)):
+                if self._cluster_by_tile[i] != cluster:
+                    i, j = j, i
+                links.setdefault(i, []).append(j)
+
+        edges = {}
+        for node, others in links.items():
+            costs, _ = self._search_cluster(cluster, [node])
+            edges[node] = {other: costs[other] for other in links if other != node and other in costs}
+            edges[node].update(dict.fromkeys(others, 1))
+
+        return edges
+
+    def _get_entrances(self, cluster: int, other: int) -> list:
+        """
+        Return the pairs of tiles through which cluster and the cluster after it,
+        either to its right or below it, are linked.
+        """
+        if (cluster, other) not in self._entrances_by_border:
+            self._entrances_by_border[(cluster, other)] = self._find_entrances(cluster, other)
+        return self._entrances_by_border[(cluster, other)]
+
+    def _find_entrances(self, cluster: int, other: int) -> list:
+        n = self.CLUSTER_TILE_COUNT
+        width = self._width
+        column, row = cluster % self._cluster_column_count, cluster // self._cluster_column_count
+
+        if other == cluster + self._cluster_column_count:
+            y = row * n + n - 1
+            pairs = [
+                (y * width + x, (y + 1) * width + x)
+                for x in range(column * n, min(column * n + n, width))
+            ]
+        else:
+            x = column * n + n - 1
+            pairs = [
+                (y * width + x, y * width + x + 1)
+                for y in range(row * n, min(row * n + n, self._height))
+            ]
+
+        components = self._get_components(cluster)
+        other_components = self._get_components(other)
+
+        entrances = []
+        for is_open, run in itertools.groupby(pairs, key=lambda pair: self._is_open(*pair)):
+            if not is_open:
+                continue
+
+            # Tiles of the same run may only be connected through the rest of the board,
+            # so every pair of components facing each other gets entrances of its own.
+            parts = {}
+            for i, j in run:
+                parts.setdefault((components[i], other_components[j]), []).append((i, j))
+
+            for part in parts.values():
+                if len(part) >= self.LONG_ENTRANCE_LENGTH:
+                    entrances += [part[0], part[-1]]
+                else:
+                    entrances.append(part[len(part) // 2])
+
+        return entrances
+
+    def _is_open(self, i: int, j: int) -> bool:
+        return not self._blocked[i] and not self._blocked[j] and i in self._neighbors[j] and j in self._neighbors[i]
+
+
+class ClusterGraphCache:
+    """
+    A class that keeps one cluster graph per margin and invalidates them as
+    tiles of board are occupied or vacated.
+    """
+
+    def __init__(self, board) -> None:
+        self.board = board
+        self._graphs_by_margin = {}
+
+    def get(self, margin: int) -> ClusterGraph:
+        if margin not in self._graphs_by_margin:
+            self._graphs_by_margin[margin] = ClusterGraph(self.board, margin)
+        return self._graphs_by_margin[margin]
+
+    def invalidate(self, i: int) -> None:
+        for graph in self._graphs_by_margin.values():
+            graph.invalidate(i)
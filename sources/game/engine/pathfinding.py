@@ -0,0 +1,231 @@
+import heapq
+from collections import deque
+
+INFINITY = 1 << 30
+
+
+class DistanceField:
+    """
+    A multi-source breadth-first distance field over the vacant tiles of a world,
+    measuring how many steps each tile is from the nearest tile within radius of
+    target. The field is repaired locally whenever a tile is occupied or vacated,
+    so every hunter with the same attack range can read its next step in O(1).
+    Given start, the field is only computed as far as a unit on tile start
+    needs to find its path, and is not meant to be repaired.
+    """
+
+    def __init__(self, cache, target, radius: int, margin: int, start: int | None = None) -> None:
+        self._width = cache.width
+        self._height = cache.height
+        self._blocked = cache.blocked
+        self._neighbors = cache.board.get_neighbors(margin)
+        self._target_x = target.x
+        self._target_y = target.y
+        self._radius = radius
+        self._margin = margin
+        self.distances = [INFINITY] * len(self._blocked)
+        self._compute(start)
+
+    def _is_source(self, i: int) -> bool:
+        x, y = i % self._width, i // self._width
+        return abs(x - self._target_x) + abs(y - self._target_y) <= self._radius
+
+    def _is_passable(self, i: int) -> bool:
+        x, y = i % self._width, i // self._width
+        return (
+            self._margin <= x < self._width - self._margin
+            and self._margin <= y < self._height - self._margin
+            and not self._blocked[i]
+        )
+
+    def _compute(self, start: int | None) -> None:
+        width = self._width
+        blocked = self._blocked
+        neighbors = self._neighbors
+        distances = self.distances
+
+        # The search stops before the layer beyond the first neighbor of start it reaches,
+        # so every tile the path of start goes through is as far as in a complete field.
+        if start is None:
+            start_neighbors = ()
+            limit = INFINITY
+        else:
+            start_neighbors = neighbors[start]
+            limit = 0 if self._is_source(start) else INFINITY
+
+        queue = deque()
+        for dy in range(-self._radius, self._radius + 1):
+            span = self._radius - abs(dy)
+            for dx in range(-span, span + 1):
+                x, y = self._target_x + dx, self._target_y + dy
+                if 0 <= x < width and 0 <= y < self._height and self._is_passable(y * width + x):
+                    distances[y * width + x] = 0
+                    queue.append(y * width + x)
+
+        while queue:
+            i = queue.popleft()
+            if distances[i] >= limit:
+                break
+            new_distance = distances[i] + 1
+            for j in neighbors[i]:
+                if distances[j] == INFINITY and not blocked[j]:
+                    distances[j] = new_distance
+                    queue.append(j)
+                    if limit == INFINITY and j in start_neighbors:
+                        limit = new_distance
+
+    def get_distance_from(self, x: int, y: int) -> int:
+        """
+        Return the number of steps a unit standing on (x, y) needs to get target within radius.
+        The tile itself may be occupied by that unit.
+        """
+        i = y * self._width + x
+        if self._is_source(i):
+            return 0
+
+        best = min((self.distances[j] for j in self._neighbors[i]), default=INFINITY)
+        return best + 1 if best < INFINITY else INFINITY
+
+    def get_path_from(self, x: int, y: int, steps: int) -> tuple:
+        """
+        Follow the field downhill from (x, y) for at most steps moves and return the path taken.
+        """
+        i = y * self._width + x
+        path = [(x, y)]
+        remaining = self.get_distance_from(x, y)
+
+        while remaining not in {0, INFINITY} and len(path) <= steps:
+            remaining -= 1
+            i = next(j for j in self._neighbors[i] if self.distances[j] == remaining)
+            path.append((i % self._width, i // self._width))
+
+        return tuple(path)
+
+    def block(self, i: int) -> None:
+        """
+        Repair the field after tile i has been occupied.
+        """
+        distances = self.distances
+        neighbors = self._neighbors
+        if distances[i] == INFINITY:
+            return
+
+        # Collect the tiles whose every shortest route led through tile i.
+        # Tiles are visited in increasing order of distance, so a tile's downhill
+        # neighbors are all settled before the tile itself is examined.
+        orphans = {i}
+        queue = deque([i])
+        while queue:
+            j = queue.popleft()
+            expected = distances[j] + 1
+            for k in neighbors[j]:
+                if (
+                    distances[k] == expected
+                    and k not in orphans
+                    and not any(distances[m] == expected - 1 and m not in orphans for m in neighbors[k])
+                ):
+                    orphans.add(k)
+                    queue.append(k)
+
+        for j in orphans:
+            distances[j] = INFINITY
+        orphans.remove(i)
+
+        # Reconnect the orphans to the rest of the field from their boundary.
+        heap = []
+        for j in orphans:
+            best = min((distances[k] for k in neighbors[j]), default=INFINITY)
+            if best < INFINITY:
+                distances[j] = best + 1
+                heapq.heappush(heap, (distances[j], j))
+
+        while heap:
+            distance, j = heapq.heappop(heap)
+            if distance > distances[j]:
+                continue
+            for k in neighbors[j]:
+                if k in orphans and distance + 1 < distances[k]:
+                    distances[k] = distance + 1
+                    heapq.heappush(heap, (distance + 1, k))
+
+    def unblock(self, i: int) -> None:
+        """
+        Repair the field after tile i has been vacated.
+        """
+        if not self._is_passable(i):
+            return
+
+        distances = self.distances
+        neighbors = self._neighbors
+        blocked = self._blocked
+
+        if self._is_source(i):
+            distances[i] = 0
+        else:
+            best = min((distances[j] for j in neighbors[i]), default=INFINITY)
+            if best == INFINITY:
+                return
+            distances[i] = best + 1
+
+        queue = deque([i])
+        while queue:
+            j = queue.popleft()
+            new_distance = distances[j] + 1
+            for k in neighbors[j]:
+                if new_distance < distances[k] and not blocked[k]:
+                    distances[k] = new_distance
+                    queue.append(k)
+
+
+class DistanceFieldCache:
+    """
+    A class that shares distance fields among hunters and keeps them up to date
+    with the occupancy grid of board.
+    Keeping a field up to date costs a repair on every move, which only pays
+    off once enough hunters read it. Short of SHARING_HUNTER_COUNT hunters,
+    every hunter gets a field of its own, computed only as far as it needs.
+    """
+
+    SHARING_HUNTER_COUNT = 12
+
+    def __init__(self, board) -> None:
+        self.board = board
+        self.width = board.width
+        self.height = board.height
+        self.blocked = board.occupancy
+        self._fields_by_target = {}
+
+    def get(self, target, radius: int, margin: int, x: int, y: int, hunter_count: int) -> DistanceField:
+        """
+        Return a field toward target for a hunter standing on (x, y), one of hunter_count hunters.
+        """
+        fields = self._fields_by_target.get(target, {})
+        if (radius, margin) not in fields:
+            if hunter_count < self.SHARING_HUNTER_COUNT:
+                return DistanceField(self, target, radius, margin, start=y * self.width + x)
+
+            fields = self._fields_by_target.setdefault(target, fields)
+            fields[(radius, margin)] = DistanceField(self, target, radius, margin)
+        return fields[(radius, margin)]
+
+    def discard(self, target) -> None:
+        """
+        Forget the fields toward target, e.g. because it has moved or perished.
+        """
+        self._fields_by_target.pop(target, None)
+
+    def block(self, i: int) -> None:
+        """
+        Repair every field after tile i has been occupied on the board.
+        """
+        for fields in self._fields_by_target.values():
+            for field in fields.values():
+                field.block(i)
+
+    def unblock(self, i: int) -> None:
+        """
+        Repair every field after tile i has been vacated on the board.
+        """
+        for fields in self._fields_by_target.values():
+            for field in fields.values():
+                field.unblock(i)
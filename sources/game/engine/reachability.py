@@ -0,0 +1,55 @@
+from collections import deque
+
+
+class ReachabilityCache:
+    """
+    A class that remembers the tiles every soldier can move to this turn.
+    Entries are keyed by the version of the board's occupancy, so they go
+    stale as soon as anything is placed onto or removed from the board.
+    """
+
+    def __init__(self, board) -> None:
+        self._board = board
+        self._entries = {}
+
+    def get(self, soldier) -> tuple:
+        """
+        Return the coordinates soldier can move to within its mobility, nearest first.
+        """
+        version, coordinates = self._entries.get(soldier, (None, None))
+        if version != self._board.version:
+            coordinates = self._compute(soldier)
+            self._entries[soldier] = (self._board.version, coordinates)
+
+        return coordinates
+
+    def refresh(self, soldiers) -> None:
+        """
+        Bring the entries of soldiers up to date, e.g. when a turn starts.
+        """
+        for soldier in soldiers:
+            self.get(soldier)
+
+    def discard(self, soldier) -> None:
+        self._entries.pop(soldier, None)
+
+    def _compute(self, soldier) -> tuple:
+        board = self._board
+        neighbors = board.get_neighbors(soldier.margin)
+        occupancy = board.occupancy
+
+        start = board.index(soldier.x, soldier.y)
+        cost_table = {start: 0}
+        queue = deque([start])
+        while queue:
+            i = queue.popleft()
+            if cost_table[i] == soldier.mobility:
+                continue
+
+            for j in neighbors[i]:
+                if j not in cost_table and not occupancy[j]:
+                    cost_table[j] = cost_table[i] + 1
+                    queue.append(j)
+
+        del cost_table[start]
+        return tuple((i % board.width, i // board.width) for i in cost_table)
@@ -0,0 +1,75 @@
+import struct
+
+from game.engine.waves import COMMON_SOLDIER_TYPE_NAMES
+
+MOVE = 1
+ATTACK = 2
+RECRUIT = 3
+END_TURN = 4
+
+MAGIC = b"TKTL"
+VERSION = 1
+
+HEADER = struct.Struct("<4sBHHq")
+# Every action starts with its opcode, followed by coordinates or a soldier type.
+STRUCT_BY_ACTION = {
+    MOVE: struct.Struct("<BHHHH"),
+    ATTACK: struct.Struct("<BHHHH"),
+    RECRUIT: struct.Struct("<BBHH"),
+    END_TURN: struct.Struct("<B"),
+}
+
+
+class ActionLog:
+    """
+    A class that records the actions of the player as a compact binary log
+    which, together with the size of the board and the seed of the game it
+    heads, is enough to play the game again exactly.
+    """
+
+    def __init__(self, width: int, height: int, seed: int) -> None:
+        # The seed is saved as a signed 64-bit integer.
+        if not 0 <= seed < 2 ** 63:
+            raise ValueError("the seed must lie between 0 and 2 ** 63 - 1")
+
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self._buffer = bytearray()
+
+    def __iter__(self):
+        """
+        Yield every action recorded as a tuple of its opcode and arguments.
+        """
+        offset = 0
+        while offset < len(self._buffer):
+            action = STRUCT_BY_ACTION[self._buffer[offset]].unpack_from(self._buffer, offset)
+            offset += STRUCT_BY_ACTION[action[0]].size
+            if action[0] == RECRUIT:
+                action = (RECRUIT, COMMON_SOLDIER_TYPE_NAMES[action[1]], *action[2:])
+            yield action
+
+    def record_move(self, soldier, x: int, y: int) -> None:
+        self._buffer += STRUCT_BY_ACTION[MOVE].pack(MOVE, soldier.x, soldier.y, x, y)
+
+    def record_attack(self, soldier, other) -> None:
+        self._buffer += STRUCT_BY_ACTION[ATTACK].pack(ATTACK, soldier.x, soldier.y, other.x, other.y)
+
+    def record_recruit(self, soldier_type_name: str, x: int, y: int) -> None:
+        self._buffer += STRUCT_BY_ACTION[RECRUIT].pack(RECRUIT, COMMON_SOLDIER_TYPE_NAMES.index(soldier_type_name), x, y)
+
+    def record_end_turn(self) -> None:
+        self._buffer += STRUCT_BY_ACTION[END_TURN].pack(END_TURN)
+
+    def to_bytes(self) -> bytes:
+        return HEADER.pack(MAGIC, VERSION, self.width, self.height, self.seed) + self._buffer
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        magic, version, width, height, seed = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not an action log of this version of the game")
+
+        action_log = cls(width, height, seed)
+        action_log._buffer[:] = data[HEADER.size:]
+        return action_log
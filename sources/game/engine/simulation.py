@@ -0,0 +1,143 @@
+from game.configuration import Configuration as C
+from game.engine import units
+from game.engine.economy import can_afford, charge_for
+from game.engine.replay import ATTACK, END_TURN, MOVE, RECRUIT
+from game.engine.waves import COMMON_SOLDIER_TYPE_NAMES
+from game.engine.world import World
+
+DEFEAT = "defeat"
+VICTORY = "victory"
+
+
+class Simulation:
+    """
+    Play a game without a display, with both armies commanded by Soldier.hunt,
+    or replay the actions a player has taken in a game.
+    """
+
+    def __init__(
+        self,
+        width: int = C.HORIZONTAL_LAND_TILE_COUNT,
+        height: int = C.VERTICAL_TILE_COUNT,
+        seed: int | None = None,
+    ) -> None:
+        self.world = World(width, height, seed)
+        self.turn = 0
+        self.allies_deployed = 1
+        self.enemies_deployed = 0
+
+        units.Barrack(self.world, width // 2, height // 2)
+        units.Hero(self.world, width // 2, height // 2 + 1, color=C.BLUE)
+
+    @classmethod
+    def replay(cls, action_log):
+        """
+        Play the game action_log was recorded in again and return it.
+        """
+        simulation = cls(action_log.width, action_log.height, action_log.seed)
+        board = simulation.world.board
+        for action, *arguments in action_log:
+            if action == MOVE:
+                x, y, *coordinate = arguments
+                board.get_entity_at(x, y).move_to(*coordinate)
+            elif action == ATTACK:
+                x, y, *coordinate = arguments
+                soldier = board.get_entity_at(x, y)
+                soldier.assault(board.get_entity_at(*coordinate))
+                soldier.promote()
+            elif action == RECRUIT:
+                simulation.recruit(*arguments)
+            elif action == END_TURN:
+                simulation.end_turn()
+
+        return simulation
+
+    @property
+    def outcome(self) -> str | None:
+        if self.world.defeated:
+            return DEFEAT
+        if self.world.victorious:
+            return VICTORY
+        return None
+
+    @property
+    def allies_lost(self) -> int:
+        return self.allies_deployed - len(self.world.allied_soldiers)
+
+    @property
+    def enemies_killed(self) -> int:
+        return self.enemies_deployed - len(self.world.enemy_soldiers)
+
+    def play(self, max_turns: int = 1000) -> str | None:
+        """
+        Play turns until the game is decided or max_turns have been played.
+        Return the outcome.
+        """
+        while self.outcome is None and self.turn < max_turns:
+            self.play_turn()
+
+        return self.outcome
+
+    def play_turn(self) -> None:
+        """
+        Play the player's turn followed by the computer's turn.
+        """
+        world = self.world
+
+        self._recruit()
+
+        for ally in list(world.allied_soldiers):
+            if not world.enemy_soldiers:
+                break
+            if not ally.attacked_this_turn:
+                ally.hunt()
+
+        self.end_turn()
+
+    def end_turn(self) -> None:
+        """
+        Play the computer's turn, or advance the day if there is no enemy left,
+        as the End turn control does.
+        """
+        self.turn += 1
+        world = self.world
+
+        if world.enemy_soldiers:
+            world.unit_store.reset_turn(world.enemy_soldiers)
+
+            for enemy in list(world.enemy_soldiers):
+                if world.defeated:
+                    break
+                if enemy in world.enemy_soldiers:
+                    enemy.hunt()
+        else:
+            for name, x, y in world.advance_day():
+                getattr(units, name)(world, x, y, color=C.RED)
+                self.enemies_deployed += 1
+
+        world.unit_store.reset_turn(world.allied_soldiers)
+
+    def _recruit(self) -> None:
+        """
+        Spend every coin on common soldiers deployed around the barracks.
+        """
+        world = self.world
+        for building in list(world.critical_buildings):
+            for x, y in building.get_vacant_neighbors():
+                soldier_type_name = world.rng.choice(COMMON_SOLDIER_TYPE_NAMES)
+                if not can_afford(world, getattr(units, soldier_type_name)):
+                    return
+
+                self.recruit(soldier_type_name, x, y)
+
+    def recruit(self, soldier_type_name: str, x: int, y: int) -> None:
+        """
+        Pay for a soldier of the given type and deploy it onto (x, y), where it
+        waits for the next turn to act.
+        """
+        soldier_type = getattr(units, soldier_type_name)
+        charge_for(self.world, soldier_type)
+        soldier = soldier_type(self.world, x, y, color=C.BLUE)
+        soldier.attacked_this_turn = True
+        soldier.moved_this_turn = True
+        self.allies_deployed += 1
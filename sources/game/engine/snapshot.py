@@ -0,0 +1,131 @@
+import struct
+
+from game.configuration import Configuration as C
+from game.engine import units
+from game.engine.replay import ActionLog
+from game.engine.units import DAMAGE_TABLE
+from game.engine.world import World
+
+MAGIC = b"TKTS"
+VERSION = 1
+
+HEADER = struct.Struct("<4sBHHqIIIB")
+# The state of the Mersenne Twister, i.e. 624 words and the position among them
+RNG_STATE = struct.Struct("<625I")
+UNIT_COUNT = struct.Struct("<I")
+UNIT = struct.Struct("<BBHHdBIBB")
+ACTION_LOG_SIZE = struct.Struct("<I")
+
+UNIT_TYPE_NAMES = ("Archer", "Barrack", "Cavalry", "Hero", "Infantry", "Wall")
+COLORS = (None, C.BLUE, C.RED)
+
+
+def save_snapshot(world: World) -> bytes:
+    """
+    Return the state of world, with the position of its random number generator
+    and the action log recorded so far, in a compact binary format.
+    """
+    version, rng_state, gauss_next = world.rng.getstate()
+    if version != 3 or gauss_next is not None:
+        raise ValueError("the random number generator of the world cannot be saved")
+
+    unit_records = [
+        UNIT.pack(
+            UNIT_TYPE_NAMES.index(type(unit).__name__),
+            COLORS.index(getattr(unit, "color", None)),
+            unit.x,
+            unit.y,
+            unit.health,
+            unit.level,
+            unit.experience,
+            unit.attacked_this_turn,
+            unit.moved_this_turn,
+        )
+        # Every group keeps the order its units were added in.
+        for group in (world.critical_buildings, world.noncritical_buildings, world.allied_soldiers, world.enemy_soldiers)
+        for unit in group
+    ]
+    action_log = world.action_log.to_bytes()
+
+    return b"".join([
+        HEADER.pack(MAGIC, VERSION, world.width, world.height, world.seed, world.day, world.wave, world.coin, world.victorious),
+        RNG_STATE.pack(*rng_state),
+        world.board.lands,
+        UNIT_COUNT.pack(len(unit_records)),
+        *unit_records,
+        ACTION_LOG_SIZE.pack(len(action_log)),
+        action_log,
+    ])
+
+
+def read_snapshot(buffer) -> tuple:
+    """
+    Restore the world saved by save_snapshot into buffer, which may be any
+    object supporting the buffer protocol, e.g. a memory-mapped file that is
+    read from in place rather than copied as a whole.
+    Return the world, without any unit on it yet, and the records of its units
+    to be passed to restore_unit once they have been created.
+    """
+    with memoryview(buffer) as view:
+        _check_size(view, HEADER.size)
+        magic, version, width, height, seed, day, wave, coin, victorious = HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a snapshot of this version of the game")
+        offset = HEADER.size
+
+        _check_size(view, offset + RNG_STATE.size + width * height + UNIT_COUNT.size)
+        rng_state = RNG_STATE.unpack_from(view, offset)
+        offset += RNG_STATE.size
+
+        world = World(width, height, seed, lands=view[offset:offset + width * height])
+        world.rng.setstate((3, rng_state, None))
+        world.day = day
+        world.wave = wave
+        world.coin = coin
+        world.victorious = bool(victorious)
+        offset += width * height
+
+        [unit_count] = UNIT_COUNT.unpack_from(view, offset)
+        offset += UNIT_COUNT.size
+        _check_size(view, offset + unit_count * UNIT.size + ACTION_LOG_SIZE.size)
+        records = [
+            (UNIT_TYPE_NAMES[type_id], COLORS[color_id], *fields)
+            for type_id, color_id, *fields in UNIT.iter_unpack(view[offset:offset + unit_count * UNIT.size])
+        ]
+        offset += unit_count * UNIT.size
+
+        [action_log_size] = ACTION_LOG_SIZE.unpack_from(view, offset)
+        offset += ACTION_LOG_SIZE.size
+        _check_size(view, offset + action_log_size)
+        world.action_log = ActionLog.from_bytes(view[offset:offset + action_log_size])
+
+    return world, records
+
+
+def _check_size(view: memoryview, size: int) -> None:
+    if len(view) < size:
+        raise ValueError("the snapshot is truncated")
+
+
+def restore_unit(unit, record: tuple) -> None:
+    """
+    Bring a unit just created from record up to the state the record was saved in.
+    """
+    _, _, _, _, unit.health, unit.level, unit.experience, unit.attacked_this_turn, unit.moved_this_turn = record
+    unit.damage_index = DAMAGE_TABLE.get_index(type(unit).__name__, unit.level)
+
+
+def load_snapshot(buffer) -> World:
+    """
+    Restore the world saved by save_snapshot into buffer, with its units.
+    """
+    world, records = read_snapshot(buffer)
+    for record in records:
+        type_name, color, x, y, *_ = record
+        if color is None:
+            unit = getattr(units, type_name)(world, x, y)
+        else:
+            unit = getattr(units, type_name)(world, x, y, color=color)
+        restore_unit(unit, record)
+
+    return world
@@ -0,0 +1,107 @@
+from array import array
+
+
+class Column:
+    """
+    A descriptor that keeps an attribute of every unit in a column of the unit
+    store of its world, at the unit's row. Read from a class, it is the default
+    that the column is filled with for new units of that class.
+    """
+
+    def __init__(self, default=0) -> None:
+        self.default = default
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, unit, owner=None):
+        if unit is None:
+            return self.default
+        return getattr(unit.store, self.name)[unit.row]
+
+    def __set__(self, unit, value) -> None:
+        getattr(unit.store, self.name)[unit.row] = value
+
+
+class UnitStore:
+    """
+    A class that lays the state of the units of a world out in flat arrays, one
+    row per unit, so that a large number of units takes little memory and the
+    state of many of them can be updated at once. Rows of units that have
+    perished are reused by the next units.
+    """
+
+    TYPECODE_BY_COLUMN = {
+        "x": "i",
+        "y": "i",
+        "health": "d",
+        "maximum_health": "d",
+        "level": "B",
+        "experience": "I",
+        "damage_index": "H",
+        "attacked_this_turn": "B",
+        "moved_this_turn": "B",
+    }
+
+    def __init__(self) -> None:
+        for name, typecode in self.TYPECODE_BY_COLUMN.items():
+            setattr(self, name, array(typecode))
+        self._free_rows = []
+
+    def __len__(self) -> int:
+        return len(self.x) - len(self._free_rows)
+
+    @property
+    def nbytes(self) -> int:
+        columns = [getattr(self, name) for name in self.TYPECODE_BY_COLUMN]
+        return sum(len(column) * column.itemsize for column in columns)
+
+    def allocate(self, unit_type) -> int:
+        """
+        Claim a row filled with the defaults of unit_type and return it.
+        """
+        if self._free_rows:
+            row = self._free_rows.pop()
+            for name in self.TYPECODE_BY_COLUMN:
+                getattr(self, name)[row] = getattr(unit_type, name)
+        else:
+            row = len(self.x)
+            for name in self.TYPECODE_BY_COLUMN:
+                getattr(self, name).append(getattr(unit_type, name))
+
+        return row
+
+    def release(self, row: int) -> None:
+        self._free_rows.append(row)
+
+    def restore_health(self, units, amount: float) -> None:
+        """
+        Restore the health of every one of units by amount (cannot exceed their maximum values).
+        """
+        healths = self.health
+        maximum_healths = self.maximum_health
+        for row in [unit.row for unit in units]:
+            healths[row] = min(healths[row] + amount, maximum_healths[row])
+
+    def reset_turn(self, units) -> None:
+        """
+        Let every one of units attack and move again.
+        """
+        attacked = self.attacked_this_turn
+        moved = self.moved_this_turn
+        for row in [unit.row for unit in units]:
+            attacked[row] = moved[row] = 0
+
+
+class UnitSet(dict):
+    """
+    A set of units kept as the keys of a dict, so that they are iterated in the
+    order they were added rather than by their addresses in memory, and a game
+    plays out the same way every time it is given the same seed.
+    """
+
+    def add(self, unit) -> None:
+        self[unit] = None
+
+    def remove(self, unit) -> None:
+        del self[unit]
@@ -0,0 +1,62 @@
+import os
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from time import perf_counter
+
+from game.configuration import Configuration as C
+from game.engine.simulation import VICTORY, Simulation
+
+
+def play_game(seed: int, width: int, height: int, max_turns: int) -> tuple:
+    """
+    Play a whole game without a display and return its outcome, the number of
+    turns it lasted, the number of allies lost and the number of enemies killed.
+    """
+    simulation = Simulation(width, height, seed)
+    outcome = simulation.play(max_turns)
+    return outcome, simulation.turn, simulation.allies_lost, simulation.enemies_killed
+
+
+def run_tournament(
+    game_count: int,
+    *,
+    seed: int = 0,
+    worker_count: int | None = None,
+    width: int = C.HORIZONTAL_LAND_TILE_COUNT,
+    height: int = C.VERTICAL_TILE_COUNT,
+    max_turns: int = 1000,
+) -> dict:
+    """
+    Play game_count games, seeded seed, seed + 1 and so on, across worker_count
+    processes (one per core by default) and return a summary of them.
+    """
+    worker_count = worker_count or os.cpu_count()
+    seeds = range(seed, seed + game_count)
+
+    start = perf_counter()
+    if worker_count == 1:
+        results = list(map(play_game, seeds, repeat(width), repeat(height), repeat(max_turns)))
+    else:
+        # Games are handed out in batches so that workers spend their time playing rather than waiting on the pipe.
+        chunksize = max(1, game_count // (worker_count * 4))
+        with ProcessPoolExecutor(worker_count) as executor:
+            results = list(executor.map(
+                play_game, seeds, repeat(width), repeat(height), repeat(max_turns),
+                chunksize=chunksize,
+            ))
+    duration = perf_counter() - start
+
+    outcomes, turns, allies_lost, enemies_killed = zip(*results)
+    return {
+        "games": game_count,
+        "workers": worker_count,
+        "seconds": duration,
+        "win_rate": outcomes.count(VICTORY) / game_count,
+        "undecided_rate": outcomes.count(None) / game_count,
+        "mean_turns": statistics.fmean(turns),
+        "mean_allies_lost": statistics.fmean(allies_lost),
+        "mean_enemies_killed": statistics.fmean(enemies_killed),
+        "games_per_second": game_count / duration,
+        "games_per_second_per_core": game_count / duration / min(worker_count, os.cpu_count()),
+    }
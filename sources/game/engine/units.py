@@ -0,0 +1,340 @@
+import inspect
+
+from game.configuration import Configuration as C
+from game.engine.damage import DamageTable, Stat
+from game.engine.store import Column
+
+MOVE_THEN_KILL = 1
+MOVE_THEN_HIT = 2
+MOVE = 3
+
+LEVEL_UP_EXPERIENCE_BY_LEVEL = {1: 4, 2: 8, 3: 16, 4: 32, 5: 65535}
+
+
+class Unit:
+    """
+    The display-independent state and rules of anything standing on the board.
+    Its state lives in a row of the unit store of its world, so instances are
+    only views onto that row.
+    """
+
+    __slots__ = ("world", "store", "row")
+
+    x = Column()
+    y = Column()
+
+    defense = Stat(0.0)
+    health = Column(100.0)
+    maximum_health = Column(100.0)
+
+    level = Column(1)
+    experience = Column(0)
+    damage_index = Column(0)
+
+    attacked_this_turn = Column(False)
+    moved_this_turn = Column(False)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Plain class attributes of a subclass, e.g. a higher health, become the
+        # defaults of the descriptors they would otherwise hide.
+        descriptors = {}
+        for name, value in vars(cls).items():
+            descriptor = inspect.getattr_static(cls.__base__, name, None)
+            if isinstance(descriptor, (Column, Stat)) and not isinstance(value, (Column, Stat)):
+                descriptors[name] = type(descriptor)(value)
+                if name == "health":
+                    descriptors["maximum_health"] = Column(value)
+
+        for name, descriptor in descriptors.items():
+            descriptor.__set_name__(cls, name)
+            setattr(cls, name, descriptor)
+
+    def __init__(self, world, x: int, y: int, *, register: bool = True) -> None:
+        self.world = world
+        self.store = world.unit_store
+        self.row = self.store.allocate(type(self))
+        self.x = x
+        self.y = y
+        self.damage_index = DAMAGE_TABLE.get_index(type(self).__name__, 1)
+        if register:
+            self._register()
+
+    def _register(self) -> None:
+        self.world.occupy(self)
+
+    def _unregister(self) -> None:
+        self.world.distance_fields.discard(self)
+        self.world.vacate(self)
+        self.store.release(self.row)
+
+    def take_damage(self, amount: float) -> None:
+        """
+        Reduce self's health by amount and remove self from the world once it reaches zero.
+        """
+        self.health -= amount
+        if self.health <= 0.0:
+            self.perish()
+
+    def perish(self) -> None:
+        self._unregister()
+
+
+class Soldier(Unit):
+
+    __slots__ = ("color", "_friends", "_foes")
+
+    attack = Stat(30.0)
+    attack_multipliers = {}
+    attack_range = 1
+
+    defense = 0.15
+    health = 100.0
+
+    mobility = 2
+
+    cost = 10
+
+    def __init__(self, world, x: int, y: int, *, color: str, register: bool = True) -> None:
+        self.color = color
+
+        match self.color:
+            case C.BLUE:
+                self._friends = world.allied_soldiers
+                self._foes = world.enemy_soldiers
+            case C.RED:
+                self._friends = world.enemy_soldiers
+                self._foes = world.allied_soldiers
+
+        super().__init__(world, x, y, register=register)
+
+    def _register(self) -> None:
+        super()._register()
+        self._friends.add(self)
+
+    def _unregister(self) -> None:
+        super()._unregister()
+        self._friends.remove(self)
+        self.world.reachability.discard(self)
+
+    @property
+    def margin(self) -> int:
+        # Allied soldiers are not allowed onto the edge of the board.
+        return 1 if self.color == C.BLUE else 0
+
+    def move_to(self, x: int, y: int) -> None:
+        """
+        Move self to the new coordinate.
+        """
+        self.world.distance_fields.discard(self)
+        self.world.vacate(self)
+        self.x = x
+        self.y = y
+        self.world.occupy(self)
+
+        self.moved_this_turn = True
+
+    def assault(self, other) -> None:
+        """
+        Make self attack other.
+        """
+        other.take_damage(self._get_damage_output_against(other))
+        self.experience += 1
+
+        self.attacked_this_turn = True
+
+    def promote(self) -> None:
+        while self.experience >= LEVEL_UP_EXPERIENCE_BY_LEVEL[self.level]:
+            self.experience -= LEVEL_UP_EXPERIENCE_BY_LEVEL[self.level]
+            self.level += 1
+            self.damage_index = DAMAGE_TABLE.get_index(type(self).__name__, self.level)
+
+    def hunt(self) -> tuple:
+        """
+        Identify the optimal rival then move toward and potentially attack it.
+        Return the path self has taken.
+        """
+        action, path, other = self.plan_hunt()
+
+        self.move_to(*path[-1])
+        if action in {MOVE_THEN_HIT, MOVE_THEN_KILL}:
+            self.assault(other)
+            self.promote()
+
+        return path
+
+    def plan_hunt(self) -> tuple:
+        """
+        Identify the optimal rival and return the action to take against it,
+        the path to approach it and the rival itself.
+        """
+        targets = list(self._foes)
+        if self.color == C.RED:
+            targets += self.world.critical_buildings
+
+        paths = [self._get_approaching_path(other) for other in targets]
+        action, i = self._rank_rivals(targets, paths)
+        return action, paths[i], targets[i]
+
+    def _rank_rivals(self, targets: list, paths: list) -> tuple:
+        """
+        Score every rival in one pass, column by column, and return the action
+        to take against the best one and its index. Rivals that can be killed
+        come first, then those that can be hit, ordered by damage dealt, then
+        those to approach, ordered by the distance left.
+        """
+        store = self.store
+        xs, ys = store.x, store.y
+        rows = [other.row for other in targets]
+
+        attack_range = self.attack_range
+        distances = [abs(xs[i] - x) + abs(ys[i] - y) for i, (x, y) in zip(rows, (path[-1] for path in paths))]
+        damage_row = DAMAGE_TABLE.get_row(self)
+        damages = [damage_row[store.damage_index[i]] for i in rows]
+        healths = [store.health[i] for i in rows]
+
+        action, *_, i = min(
+            (MOVE, distance, -damage, health, i) if distance > attack_range
+            else (MOVE_THEN_HIT, -damage, health, distance, i) if damage < health
+            else (MOVE_THEN_KILL, -damage, distance, i)
+            for i, distance, damage, health in zip(range(len(targets)), distances, damages, healths)
+        )
+        return action, i
+
+    def _get_approaching_path(self, other) -> tuple:
+        """
+        Compute the shortest path for self to move toward other until other is
+        within self's attack range, reading a distance field toward other, shared
+        with the soldiers of the same attack range once they are many, or searching
+        the cluster graph on large boards. When other cannot be reached within self's attack range,
+        e.g. because it is surrounded by obstacles, approach it as close as possible.
+        Trim the path so that it ends at the furthest coordinate self can reach
+        this turn and return it.
+        """
+        components = self.world.components.get(self.margin)
+        radius = components.get_approaching_radius(self.x, self.y, other, self.attack_range)
+
+        if self.world.hierarchical:
+            graph = self.world.cluster_graphs.get(self.margin)
+            return graph.get_path_from(self.x, self.y, other, radius, self.mobility)
+
+        field = self.world.distance_fields.get(other, radius, self.margin, self.x, self.y, len(self._friends))
+        return field.get_path_from(self.x, self.y, self.mobility)
+
+    def _get_damage_output_against(self, other) -> float:
+        return DAMAGE_TABLE.get_damage(self, other)
+
+
+class Archer(Soldier):
+
+    __slots__ = ()
+
+    attack_multipliers = {
+        "Cavalry": 0.7,
+        "Hero": 0.7,
+        "Infantry": 1.5,
+    }
+    attack_range = 3
+
+
+class Cavalry(Soldier):
+
+    __slots__ = ()
+
+    attack_multipliers = {
+        "Archer": 1.5,
+        "Hero": 0.7,
+        "Infantry": 0.7,
+    }
+
+    mobility = 3
+
+
+class Hero(Soldier):
+
+    __slots__ = ()
+
+    attack = 40.0
+    attack_multipliers = {
+        "Archer": 1.5,
+        "Cavalry": 1.5,
+        "Hero": 1.5,
+        "Infantry": 1.5,
+    }
+
+    health = 200.0
+
+    mobility = 3
+
+    cost = 65535
+
+
+class Infantry(Soldier):
+
+    __slots__ = ()
+
+    attack_multipliers = {
+        "Archer": 0.7,
+        "Cavalry": 1.5,
+        "Hero": 0.7,
+    }
+    attack_range = 2
+
+    defense = 0.25
+
+
+class Building(Unit):
+
+    __slots__ = ()
+
+    defense = 0.4
+    health = 400.0
+
+    def get_vacant_neighbors(self) -> list:
+        """
+        Return the vacant coordinates around self where soldiers can be deployed.
+        """
+        board = self.world.board
+        neighbors = []
+        for dx, dy in {
+            (1, 0), (1, 1), (0, 1), (-1, 1),
+            (-1, 0), (-1, -1), (0, -1), (1, -1),
+        }:
+            x, y = self.x + dx, self.y + dy
+            if board.contains(x, y, margin=1) and board.is_vacant(x, y):
+                neighbors.append((x, y))
+
+        return neighbors
+
+
+class Barrack(Building):
+
+    __slots__ = ()
+
+    def _register(self) -> None:
+        super()._register()
+        self.world.critical_buildings.add(self)
+
+    def _unregister(self) -> None:
+        super()._unregister()
+        self.world.critical_buildings.remove(self)
+
+
+class Wall(Building):
+
+    __slots__ = ()
+
+    defense = 0.5
+    health = 100.0
+
+    def _register(self) -> None:
+        super()._register()
+        self.world.noncritical_buildings.add(self)
+
+    def _unregister(self) -> None:
+        super()._unregister()
+        self.world.noncritical_buildings.remove(self)
+
+
+# A level past the last one in LEVEL_UP_EXPERIENCE_BY_LEVEL is reachable as well.
+Unit.damage_table = DAMAGE_TABLE = DamageTable((Archer, Barrack, Cavalry, Hero, Infantry, Wall), len(LEVEL_UP_EXPERIENCE_BY_LEVEL) + 1)
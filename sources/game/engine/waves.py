@@ -0,0 +1,58 @@
+from math import ceil
+
+COMMON_SOLDIER_TYPE_NAMES = ("Archer", "Cavalry", "Infantry")
+WAVE_COUNT = len(COMMON_SOLDIER_TYPE_NAMES) + 9
+
+
+def get_spawn_areas(width: int, height: int) -> list:
+    """
+    Return the four corner areas of a width by height board where enemies spawn.
+    """
+    H = width
+    V = height
+    # The strips along the sides are as deep as they fit without the northern and southern ones overlapping.
+    D = min(6, V // 2)
+    area_north_east = [
+        *[(x, 0) for x in range(H - 3, H - 1)],     #     2
+        *[(H - 1, y) for y in range(D)],            #     ▔▕ D
+    ]
+    area_north_west = [
+        *[(x, 0) for x in range(1, 3)],             #    2
+        *[(0, y) for y in range(D)],                # D▕ ▔
+    ]
+    area_south_east = [
+        *[(H - 1, y) for y in range(V - D, V)],     #     ▁▕ D
+        *[(x, V - 1) for x in range(H - 3, H - 1)], #     2
+    ]
+    area_south_west = [
+        *[(0, y) for y in range(V - D, V)],         # D▕ ▁
+        *[(x, V - 1) for x in range(1, 3)],         #    2
+    ]
+    return [area_north_east, area_north_west, area_south_east, area_south_west]
+
+
+def plan_wave(wave: int, board, rng, debut_order: tuple) -> list:
+    """
+    Return the soldier type names and coordinates that make up the given wave,
+    drawn with rng among the vacant tiles of board. Each common soldier type debuts
+    alone in one of the first waves, in debut_order; after that, waves grow by two
+    soldiers at a time and spread over more areas.
+    """
+    areas = get_spawn_areas(board.width, board.height)
+
+    def sample_n_coordinates_from_m_areas(n: int, m: int) -> list:
+        # Every tile is only offered once, so that no two soldiers spawn on the same one.
+        coordinates = {}
+        for area in rng.sample(areas, m):
+            coordinates.update(dict.fromkeys(coordinate for coordinate in area if board.is_vacant(*coordinate)))
+        return rng.sample(list(coordinates), min(n, len(coordinates)))
+
+    if wave <= len(COMMON_SOLDIER_TYPE_NAMES):
+        return [(debut_order[wave - 1], x, y) for x, y in sample_n_coordinates_from_m_areas(1, 1)]
+
+    n = (wave - len(COMMON_SOLDIER_TYPE_NAMES)) * 2
+    m = ceil(n / 6)
+    return [
+        (rng.choice(COMMON_SOLDIER_TYPE_NAMES), x, y)
+        for x, y in sample_n_coordinates_from_m_areas(n, m)
+    ]
@@ -0,0 +1,91 @@
+from random import Random, randrange
+
+from game.configuration import Configuration as C
+from game.engine.board import Board
+from game.engine.connectivity import ConnectedComponentsCache
+from game.engine.economy import pay_allowance, restore_allied_health
+from game.engine.hierarchy import ClusterGraphCache
+from game.engine.pathfinding import DistanceFieldCache
+from game.engine.reachability import ReachabilityCache
+from game.engine.replay import ActionLog
+from game.engine.store import UnitSet, UnitStore
+from game.engine.waves import COMMON_SOLDIER_TYPE_NAMES, WAVE_COUNT, plan_wave
+
+
+class World:
+    """
+    A class that holds the display-independent state of a game.
+    """
+
+    def __init__(self, width: int, height: int, seed: int | None = None, *, lands: bytes | None = None) -> None:
+        self.width = width
+        self.height = height
+        # Every random draw of a game is made from this, so the seed reproduces it.
+        self.seed = randrange(2 ** 63) if seed is None else seed
+        self.rng = Random(self.seed)
+        # Drawn first, so that a world restored from a snapshot draws the same order.
+        self.debut_order = tuple(self.rng.sample(COMMON_SOLDIER_TYPE_NAMES, len(COMMON_SOLDIER_TYPE_NAMES)))
+        self.action_log = ActionLog(width, height, self.seed)
+
+        self.day = 1
+        self.wave = 0
+        self.coin = 10
+        self.victorious = False
+
+        self.board = Board(width, height)
+        if lands is None:
+            self.board.lay_out_landscape(self.rng)
+        else:
+            self.board.set_lands(lands)
+        self.unit_store = UnitStore()
+        self.allied_soldiers = UnitSet()
+        self.enemy_soldiers = UnitSet()
+        self.critical_buildings = UnitSet()
+        self.noncritical_buildings = UnitSet()
+        self.distance_fields = DistanceFieldCache(self.board)
+        self.cluster_graphs = ClusterGraphCache(self.board)
+        self.components = ConnectedComponentsCache(self.board)
+        # Distance fields span the whole board, so large boards are searched hierarchically instead.
+        self.hierarchical = width * height >= C.HIERARCHICAL_PATHFINDING_TILE_COUNT
+        self.reachability = ReachabilityCache(self.board)
+
+    @property
+    def defeated(self) -> bool:
+        return not self.allied_soldiers and not self.critical_buildings
+
+    def occupy(self, unit) -> None:
+        i = self.board.place(unit)
+        self.distance_fields.block(i)
+        self.cluster_graphs.invalidate(i)
+        self.components.block(i)
+
+    def vacate(self, unit) -> None:
+        i = self.board.remove(unit)
+        self.distance_fields.unblock(i)
+        self.cluster_graphs.invalidate(i)
+        self.components.unblock(i)
+
+    def advance_day(self) -> list:
+        """
+        Move on to the next day of the three-day cycle: allies rest on the first
+        day, a new wave arrives on the second and allowance is paid on the third.
+        Return the soldier type names and coordinates of the arriving wave, if any.
+        """
+        if self.victorious:
+            return []
+
+        self.day += 1
+        match (self.day - 2) % 3:
+            case 0:
+                restore_allied_health(self)
+            case 1:
+                if self.wave == WAVE_COUNT:
+                    self.victorious = True
+                else:
+                    self.wave += 1
+                    return plan_wave(self.wave, self.board, self.rng, self.debut_order)
+            case 2:
+                pay_allowance(self)
+                restore_allied_health(self)
+
+        return []
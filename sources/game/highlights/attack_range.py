@@ -2,14 +2,23 @@ import tkinter as tk
 
 from game.base import GameObject
 from game.miscellaneous import Image, get_pixels
-from game.states import HighlightState
+from game.states import Session
 
 
 class AttackRangeHighlight(GameObject):
 
-    def __init__(self, canvas: tk.Canvas, x: int, y: int, *, half_diagonal: int, attach: bool = True) -> None:
+    def __init__(
+        self,
+        session: Session,
+        canvas: tk.Canvas,
+        x: int,
+        y: int,
+        *,
+        half_diagonal: int,
+        attach: bool = True,
+    ) -> None:
         self._half_diagonal = half_diagonal
-        super().__init__(canvas, x, y, attach=attach)
+        super().__init__(session, canvas, x, y, attach=attach)
 
     def _create_widgets(self) -> None:
         pass
@@ -18,13 +27,16 @@ class AttackRangeHighlight(GameObject):
         pass
 
     def _register(self) -> None:
-        HighlightState.attack_range_highlight = self
+        self._session.highlight.attack_range_highlight = self
 
     def _unregister(self) -> None:
-        HighlightState.attack_range_highlight = None
+        self._session.highlight.attack_range_highlight = None
 
     def attach_widgets_to_canvas(self) -> None:
+        self._image = getattr(Image, "red_diamond_{0}x{0}".format(self._half_diagonal * 120))
         self._main_widget_id = self._canvas.create_image(
             *get_pixels(self.x, self.y),
-            image=getattr(Image, "red_diamond_{0}x{0}".format(self._half_diagonal * 120)),
+            image=self._image,
         )
+        # Keep units drawn as canvas items above the diamond.
+        self._canvas.tag_raise(self._main_widget_id, "landscape")
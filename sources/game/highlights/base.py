@@ -0,0 +1,61 @@
+import tkinter as tk
+
+from game.base import GameObject
+from game.miscellaneous import get_pixels
+from game.states import Session
+
+
+class HighlightPool:
+
+    def __init__(self) -> None:
+        self.idle_highlights = []
+
+
+class PooledHighlight(GameObject):
+    """
+    A highlight whose widgets are hidden and kept for reuse once released,
+    so that showing it again only moves them.
+    Every subclass keeps a pool of its own in every session.
+    """
+
+    @classmethod
+    def get_pool(cls, session: Session) -> HighlightPool:
+        if cls not in session.highlight.pool_by_type:
+            session.highlight.pool_by_type[cls] = HighlightPool()
+        return session.highlight.pool_by_type[cls]
+
+    @classmethod
+    def acquire(cls, session: Session, canvas: tk.Canvas, x: int, y: int):
+        """
+        Show a highlight on (x, y), reusing a released one if there is any.
+        """
+        pool = cls.get_pool(session)
+        if not pool.idle_highlights:
+            return cls(session, canvas, x, y)
+
+        highlight = pool.idle_highlights.pop()
+
+        highlight.x = x
+        highlight.y = y
+        highlight._register()
+        highlight._canvas.coords(highlight._main_widget_id, *get_pixels(x, y))
+        highlight._canvas.itemconfigure(highlight._main_widget_id, state=tk.NORMAL)
+        highlight._main_widget.lift()
+
+        return highlight
+
+    @classmethod
+    def preload(cls, session: Session, canvas: tk.Canvas, count: int) -> None:
+        """
+        Create hidden highlights until at least count of them are waiting in the pool.
+        """
+        for _ in range(count - len(cls.get_pool(session).idle_highlights)):
+            cls(session, canvas, 0, 0).release()
+
+    def release(self) -> None:
+        """
+        Hide self and return it to the pool.
+        """
+        self._unregister()
+        self._canvas.itemconfigure(self._main_widget_id, state=tk.HIDDEN)
+        self.get_pool(self._session).idle_highlights.append(self)
@@ -1,22 +1,22 @@
 from tkinter import ttk
 
-from game.base import GameObject
+from game.highlights.base import PooledHighlight
 from game.miscellaneous import Image
-from game.states import HighlightState
 
 
-class MovementHighlight(GameObject):
+class MovementHighlight(PooledHighlight):
 
     def _create_widgets(self) -> None:
+        self._image = Image.transparent_12x12
         self._main_widget = ttk.Label(
             self._canvas,
             cursor="arrow",
             style="Flat.Royalblue1.TButton",
-            image=Image.transparent_12x12,
+            image=self._image,
         )
 
     def _register(self) -> None:
-        HighlightState.movement_highlights.add(self)
+        self._session.highlight.movement_highlights.add(self)
 
     def _unregister(self) -> None:
-        HighlightState.movement_highlights.remove(self)
+        self._session.highlight.movement_highlights.remove(self)
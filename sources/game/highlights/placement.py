@@ -1,42 +1,49 @@
 from tkinter import ttk
 
-from game.base import GameObject
-from game.miscellaneous import Configuration as C
+from game.configuration import Configuration as C
+from game.engine.economy import charge_for
+from game.highlights.base import PooledHighlight
 from game.miscellaneous import Image
-from game.states import DisplayState, GameState, HighlightState, RecruitmentState
 
 
-class PlacementHighlight(GameObject):
+class PlacementHighlight(PooledHighlight):
 
     def _create_widgets(self) -> None:
+        self._image = Image.transparent_12x12
         self._main_widget = ttk.Button(
             self._canvas,
             command=self.handle_click_event,
             cursor="hand2",
             style="Flat.Royalblue1.TButton",
             takefocus=False,
-            image=Image.transparent_12x12,
+            image=self._image,
         )
 
     def _register(self) -> None:
-        HighlightState.placement_highlights.add(self)
+        self._session.highlight.placement_highlights.add(self)
 
     def _unregister(self) -> None:
-        HighlightState.placement_highlights.remove(self)
+        self._session.highlight.placement_highlights.remove(self)
 
     def handle_click_event(self) -> None:
-        recruitment = GameState.selected_game_objects[-1]
+        if self._session.input_lock.is_locked():
+            return
 
-        GameState.coin -= recruitment.target.cost
-        if DisplayState.coin_display:
-            DisplayState.coin_display.refresh_widgets()
-        for _recruitment in RecruitmentState.barrack_recruitments:
-            _recruitment.refresh_widgets()
+        world = self._session.game.world
+        recruitment = self._session.game.selected_game_objects[-1]
 
-        soldier = recruitment.target(self._canvas, self.x, self.y, attach=False, color=C.BLUE)
+        world.action_log.record_recruit(recruitment.target.__name__, self.x, self.y)
+        charge_for(world, recruitment.target)
+        if self._session.display.coin_display:
+            self._session.display.coin_display.mark_dirty()
+        for _recruitment in self._session.recruitment.barrack_recruitments:
+            _recruitment.mark_dirty()
+
+        soldier = recruitment.target(self._session, self._canvas, self.x, self.y, attach=False, color=C.BLUE)
         soldier.attacked_this_turn = True
         soldier.moved_this_turn = True
         soldier.refresh_widgets()
         soldier.attach_widgets_to_canvas()
+        self._session.view.viewport.refresh_units()
 
         recruitment.handle_click_event()
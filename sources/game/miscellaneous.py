@@ -1,53 +1,92 @@
 import tkinter as tk
+from collections import OrderedDict
 from glob import glob
 from pathlib import PurePath
 from tkinter import ttk
 
+from game.configuration import Configuration
 
-class Configuration:
+
+class Environment:
+
+    TCL_TK_VERSION = None
+    WINDOWING_SYSTEM = None
+
+
+class InputLock:
     """
-    A class that manages colors and dimensional settings.
+    A class that tells the click and press handlers of a session to ignore the
+    user while the computer is acting. Acquisitions nest, so input is accepted
+    again only once every holder has released the lock.
     """
 
-    BLUE = "#043E6F"
-    GRAY = "#3B3B3B"
-    RED = "#801110"
-    COLOR_NAME_BY_HEX_TRIPLET = {
-        BLUE: "blue",
-        GRAY: "gray",
-        RED: "red",
-    }
-
-    # In pixels
-    TILE_DIMENSION = 60
-    HEALTH_BAR_LENGTH = 45
-
-    HORIZONTAL_LAND_TILE_COUNT = 21
-    HORIZONTAL_SHORE_TILE_COUNT = 1
-    HORIZONTAL_OCEAN_TILE_COUNT = 2
-    HORIZONTAL_TILE_COUNT = (
-        HORIZONTAL_LAND_TILE_COUNT + HORIZONTAL_SHORE_TILE_COUNT + HORIZONTAL_OCEAN_TILE_COUNT
-    )
-    VERTICAL_TILE_COUNT = 13
+    def __init__(self) -> None:
+        self._holder_count = 0
 
+    def acquire(self) -> None:
+        self._holder_count += 1
 
-class Environment:
+    def release(self) -> None:
+        if self._holder_count == 0:
+            raise RuntimeError("InputLock released more times than acquired.")
+        self._holder_count -= 1
+
+    def is_locked(self) -> bool:
+        return self._holder_count > 0
+
+
+class _LazyImageMeta(type):
+
+    def __getattr__(cls, name: str) -> tk.PhotoImage:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return cls.load(name)
 
-    SCREEN_HEIGHT = None
-    SCREEN_WIDTH = None
-    TCL_TK_VERSION = None
-    WINDOWING_SYSTEM = None
 
+class Image(metaclass=_LazyImageMeta):
+    """
+    A class that decodes images on first access as attributes of the class,
+    keeping the most recently used ones in a bounded cache.
+    Whoever displays an image must hold a reference to it, since an evicted
+    image is deleted from Tk as soon as nothing else refers to it.
+    """
 
-class Image:
+    CACHE_SIZE = 48
+
+    _paths = {}
+    _cache = OrderedDict()
 
     @classmethod
     def initialize(cls) -> None:
         """
-        Hook all images onto cls.
+        Index all images by name without decoding any of them.
         """
-        for path in glob("images/*"):
-            setattr(cls, PurePath(path).stem, tk.PhotoImage(file=path))
+        cls._paths = {PurePath(path).stem: path for path in glob("images/*")}
+
+    @classmethod
+    def load(cls, name: str) -> tk.PhotoImage:
+        if name in cls._cache:
+            cls._cache.move_to_end(name)
+            return cls._cache[name]
+
+        if name not in cls._paths:
+            raise AttributeError(name)
+
+        image = cls._cache[name] = tk.PhotoImage(file=cls._paths[name])
+        if len(cls._cache) > cls.CACHE_SIZE:
+            cls._cache.popitem(last=False)
+
+        return image
+
+    @classmethod
+    def preload(cls, widget: tk.Misc, names: list) -> None:
+        """
+        Decode the images of names one at a time whenever the event loop is idle.
+        """
+        names = [name for name in names if name not in cls._cache]
+        if names:
+            cls.load(names[0])
+            widget.after_idle(cls.preload, widget, names[1:])
 
 
 class Style:
@@ -123,11 +162,3 @@ def get_pixels(x: int, y: int, *, x_pixel_shift: float = 0.0, y_pixel_shift: flo
         Configuration.TILE_DIMENSION * (y + 0.5) + y_pixel_shift,
     )
 
-
-def msleep(widget: tk.Misc, time: int) -> None:
-    """
-    Sleep for time milliseconds.
-    """
-    flag = tk.BooleanVar()
-    widget.after(time, flag.set, True)
-    widget.wait_variable(flag)
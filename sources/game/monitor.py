@@ -0,0 +1,152 @@
+import logging
+import sys
+import threading
+import tkinter as tk
+from pathlib import Path
+from time import perf_counter
+
+logger = logging.getLogger(__name__)
+
+SOURCES = Path(__file__).resolve().parent.parent
+
+
+class LatencyMonitor:
+    """
+    A class that, once enabled, measures how late the Tk event loop gets around to
+    a heartbeat scheduled every INTERVAL milliseconds, and keeps a histogram of the lags.
+    While a heartbeat is overdue by more than STALL_THRESHOLD milliseconds, a
+    watchdog thread samples the stack of the main thread, and the stall is
+    logged with the call site it was caught in once the heartbeat comes through.
+    """
+
+    INTERVAL = 50
+    STALL_THRESHOLD = 200
+    # Lags are counted in buckets of a millisecond, the last one holding every longer lag.
+    BUCKET_COUNT = 1000
+
+    enabled = False
+    displays = set()
+    beat_count = 0
+    longest_lag = 0
+    stall_count = 0
+
+    _widget = None
+    _after_id = None
+    _expected_time = None
+    _stall_site = None
+    _histogram = [0] * BUCKET_COUNT
+    _watchdog = None
+    _stopping = None
+
+    @classmethod
+    def start(cls, widget: tk.Misc) -> None:
+        if not cls.enabled or cls._after_id:
+            return
+
+        cls._widget = widget
+        cls._schedule_beat()
+
+        cls._stopping = threading.Event()
+        cls._watchdog = threading.Thread(
+            target=cls._watch,
+            args=(threading.main_thread().ident, cls._stopping),
+            name="LatencyMonitor",
+            daemon=True,
+        )
+        cls._watchdog.start()
+
+    @classmethod
+    def stop(cls) -> None:
+        if cls._after_id:
+            try:
+                cls._widget.after_cancel(cls._after_id)
+            except tk.TclError:
+                # The window has already been destroyed, along with its timers.
+                pass
+            cls._after_id = None
+        if cls._watchdog:
+            cls._stopping.set()
+            cls._watchdog.join()
+            cls._watchdog = None
+        cls._expected_time = None
+
+    @classmethod
+    def get_percentile(cls, percentile: float) -> int:
+        """
+        Return the lag, in milliseconds, that percentile percent of the heartbeats have not exceeded.
+        """
+        if not cls.beat_count:
+            return 0
+
+        rank = cls.beat_count * percentile / 100
+        count = 0
+        for lag, bucket in enumerate(cls._histogram):
+            count += bucket
+            if count >= rank:
+                return lag
+
+        return cls.BUCKET_COUNT - 1
+
+    @classmethod
+    def to_json(cls) -> dict:
+        return {
+            "interval_ms": cls.INTERVAL,
+            "beat_count": cls.beat_count,
+            "p50_ms": cls.get_percentile(50),
+            "p99_ms": cls.get_percentile(99),
+            "max_ms": cls.longest_lag,
+            "stall_count": cls.stall_count,
+            "histogram": {lag: count for lag, count in enumerate(cls._histogram) if count},
+        }
+
+    @classmethod
+    def _schedule_beat(cls) -> None:
+        cls._expected_time = perf_counter() + cls.INTERVAL / 1000
+        cls._after_id = cls._widget.after(cls.INTERVAL, cls._beat)
+
+    @classmethod
+    def _beat(cls) -> None:
+        lag = max(0, round((perf_counter() - cls._expected_time) * 1000))
+        cls.beat_count += 1
+        cls.longest_lag = max(cls.longest_lag, lag)
+        cls._histogram[min(lag, cls.BUCKET_COUNT - 1)] += 1
+
+        if lag >= cls.STALL_THRESHOLD:
+            cls.stall_count += 1
+            logger.warning("The event loop stalled for %d ms in %s", lag, cls._stall_site or "an unknown call site")
+
+        # The watchdog only samples again once the next heartbeat is overdue.
+        cls._schedule_beat()
+        cls._stall_site = None
+
+        for display in cls.displays:
+            display.mark_dirty()
+
+    @classmethod
+    def _watch(cls, thread_id: int, stopping: threading.Event) -> None:
+        while not stopping.wait(cls.INTERVAL / 1000):
+            expected_time = cls._expected_time
+            if (
+                expected_time is None
+                or cls._stall_site is not None
+                or perf_counter() - expected_time < cls.STALL_THRESHOLD / 1000
+            ):
+                continue
+
+            if frame := sys._current_frames().get(thread_id):
+                cls._stall_site = cls._locate(frame)
+
+    @staticmethod
+    def _locate(frame) -> str:
+        """
+        Return where the innermost frame of the game's own code in the stack of frame is.
+        """
+        innermost = frame
+        while frame:
+            path = Path(frame.f_code.co_filename)
+            if path.is_relative_to(SOURCES) and path.name != "monitor.py":
+                innermost = frame
+                break
+            frame = frame.f_back
+
+        return f"{innermost.f_code.co_name} ({innermost.f_code.co_filename}:{innermost.f_lineno})"
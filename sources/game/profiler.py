@@ -0,0 +1,156 @@
+import tkinter as tk
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+
+
+class _CountingTkApp:
+    """
+    A stand-in for the Tcl interpreter of a window that counts and times every
+    call made to Tk through it, handing everything else over to the interpreter.
+    """
+
+    def __init__(self, tkapp) -> None:
+        self._tkapp = tkapp
+
+    def __getattr__(self, name: str):
+        return getattr(self._tkapp, name)
+
+    def call(self, *args):
+        start = perf_counter()
+        try:
+            return self._tkapp.call(*args)
+        finally:
+            Profiler.count_tk_call(args, perf_counter() - start)
+
+
+class Profiler:
+    """
+    A class that, once enabled, records the wall time of every phase of the
+    turns played by the End turn control of a session and the calls made to Tk
+    during them, to be exported as JSON or as a trace for flame graph viewers.
+    Phases nest, and every phase also records the calls to Tk made within it.
+    Calls to Tk are counted for the whole interpreter, which every session hosted
+    by the same process shares.
+    """
+
+    enabled = False
+
+    _origin = perf_counter()
+    _tk_call_count = 0
+    _tk_time = 0.0
+    _tk_call_counts = Counter()
+
+    def __init__(self) -> None:
+        self.turns = []
+        self._turn = None
+        self._depth = 0
+
+    @classmethod
+    def attach(cls, window: tk.Tk) -> None:
+        """
+        Count the calls made to Tk by window and the widgets created in it from now on.
+        """
+        window.tk = _CountingTkApp(window.tk)
+
+    @classmethod
+    def count_tk_call(cls, args: tuple, duration: float) -> None:
+        # Tk is called either with the words of a command or with a single tuple of them.
+        if len(args) == 1 and isinstance(args[0], tuple):
+            args = args[0]
+
+        match args:
+            case (str(path), "create", kind, *_) if path.startswith("."):
+                command = f"create_{kind}"
+            case (str(path), subcommand, *_) if path.startswith((".", "pyimage")):
+                command = str(subcommand)
+            case (command, *_):
+                command = str(command)
+            case _:
+                return
+
+        cls._tk_call_count += 1
+        cls._tk_time += duration
+        cls._tk_call_counts[command] += 1
+
+    def start_turn(self) -> None:
+        if not self.enabled:
+            return
+
+        self._turn = {
+            "turn": len(self.turns) + 1,
+            "start_ms": self._get_time(),
+            "phases": [],
+            "tk_call_count": self._tk_call_count,
+            "tk_ms": self._tk_time * 1000,
+            "tk_calls": self._tk_call_counts.copy(),
+        }
+
+    def end_turn(self) -> None:
+        if not self.enabled or self._turn is None:
+            return
+
+        turn = self._turn
+        turn["duration_ms"] = self._get_time() - turn["start_ms"]
+        turn["busy_ms"] = sum(phase["duration_ms"] for phase in turn["phases"] if not phase["depth"])
+        turn["tk_call_count"] = self._tk_call_count - turn["tk_call_count"]
+        turn["tk_ms"] = self._tk_time * 1000 - turn["tk_ms"]
+        turn["tk_calls"] = dict((self._tk_call_counts - turn["tk_calls"]).most_common())
+        self.turns.append(turn)
+        self._turn = None
+
+    def phase(self, name: str):
+        """
+        Return a context manager that records the code run within it as a phase
+        of the current turn, or does nothing unless profiling.
+        """
+        if not self.enabled or self._turn is None:
+            return nullcontext()
+        return self._record_phase(name)
+
+    @contextmanager
+    def _record_phase(self, name: str):
+        phase = {
+            "name": name,
+            "depth": self._depth,
+            "start_ms": self._get_time(),
+            "tk_call_count": self._tk_call_count,
+            "tk_ms": self._tk_time * 1000,
+        }
+        self._turn["phases"].append(phase)
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            phase["duration_ms"] = self._get_time() - phase["start_ms"]
+            phase["tk_call_count"] = self._tk_call_count - phase["tk_call_count"]
+            phase["tk_ms"] = self._tk_time * 1000 - phase["tk_ms"]
+
+    def to_json(self) -> dict:
+        return {"turns": self.turns}
+
+    def to_trace(self) -> dict:
+        """
+        Return the turns and their phases as complete events of the Trace Event
+        Format, which Chrome's trace viewer, Perfetto and speedscope draw as
+        flame graphs.
+        """
+        events = []
+        for turn in self.turns:
+            for event, name in ((turn, f"turn {turn['turn']}"), *((phase, phase["name"]) for phase in turn["phases"])):
+                events.append({
+                    "name": name,
+                    "ph": "X",
+                    "ts": event["start_ms"] * 1000,
+                    "dur": event["duration_ms"] * 1000,
+                    "pid": 1,
+                    "tid": 1,
+                    "args": {"tk_call_count": event["tk_call_count"], "tk_ms": event["tk_ms"]},
+                })
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    @classmethod
+    def _get_time(cls) -> float:
+        return (perf_counter() - cls._origin) * 1000
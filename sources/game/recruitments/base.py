@@ -2,11 +2,11 @@ from abc import abstractmethod
 from tkinter import ttk
 
 from game.base import GameObject
+from game.configuration import Configuration as C
+from game.engine.economy import can_afford
 from game.highlights import PlacementHighlight
-from game.miscellaneous import Configuration as C
 from game.miscellaneous import Image
 from game.soldiers.base import Soldier
-from game.states import ControlState, GameState, HighlightState, RecruitmentState
 
 
 class SoldierRecruitment(GameObject):
@@ -18,38 +18,47 @@ class SoldierRecruitment(GameObject):
 
     def _create_widgets(self) -> None:
         self._main_widget = ttk.Button(self._canvas, takefocus=False)
+        self._color = None
         self.refresh_widgets()
 
     def _register(self) -> None:
-        RecruitmentState.barrack_recruitments.add(self)
+        self._session.recruitment.barrack_recruitments.add(self)
 
     def _unregister(self) -> None:
-        RecruitmentState.barrack_recruitments.remove(self)
+        self._session.recruitment.barrack_recruitments.remove(self)
 
     def refresh_widgets(self) -> None:
-        if GameState.coin >= self.target.cost:
+        if can_afford(self._session.game.world, self.target):
             color = C.BLUE
         else:
             color = C.GRAY
 
+        if color == self._color:
+            return
+        self._color = color
+
         color_name = C.COLOR_NAME_BY_HEX_TRIPLET[color]
         soldier_name = self.target.__name__.lower()
+        self._image = getattr(Image, f"{color_name}_{soldier_name}_1")
 
         self._main_widget.configure(
             command=(self.handle_click_event if color == C.BLUE else (lambda: None)),
             cursor="hand2",
-            image=getattr(Image, f"{color_name}_{soldier_name}_1"),
+            image=self._image,
             style=f"Custom{color_name.capitalize()}.TButton",
         )
 
     def handle_click_event(self) -> None:
-        match GameState.selected_game_objects:
+        if self._session.input_lock.is_locked():
+            return
+
+        match self._session.game.selected_game_objects:
             case [_]:
                 self._handle_selection()
-                GameState.selected_game_objects.append(self)
+                self._session.game.selected_game_objects.append(self)
             case [_, SoldierRecruitment() as recruitment]:
                 if recruitment is self:
-                    GameState.selected_game_objects.pop()
+                    self._session.game.selected_game_objects.pop()
                     self._handle_deselection()
                 else:
                     recruitment.handle_click_event()
@@ -58,22 +67,13 @@ class SoldierRecruitment(GameObject):
                 raise NotImplementedError(rest)
 
     def _handle_selection(self) -> None:
-        [building] = GameState.selected_game_objects
-        for dx, dy in {
-            (1, 0), (1, 1), (0, 1), (-1, 1),
-            (-1, 0), (-1, -1), (0, -1), (1, -1),
-        }:
-            x, y = building.x + dx, building.y + dy
-            if (
-                0 < x < C.HORIZONTAL_LAND_TILE_COUNT - 1
-                and 0 < y < C.VERTICAL_TILE_COUNT - 1
-                and (x, y) not in GameState.occupied_coordinates
-            ):
-                PlacementHighlight(self._canvas, x, y)
-
-        if ControlState.display_outcome_control:
-            ControlState.display_outcome_control._main_widget.lift()
+        [building] = self._session.game.selected_game_objects
+        for x, y in building.get_vacant_neighbors():
+            PlacementHighlight.acquire(self._session, building._canvas, x, y)
+
+        if self._session.control.display_outcome_control:
+            self._session.control.display_outcome_control._main_widget.lift()
 
     def _handle_deselection(self) -> None:
-        for highlight in list(HighlightState.placement_highlights):
-            highlight.detach_and_destroy_widgets()
+        for highlight in list(self._session.highlight.placement_highlights):
+            highlight.release()
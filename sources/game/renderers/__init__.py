@@ -0,0 +1,7 @@
+from game.renderers.canvas import CanvasRenderer
+from game.renderers.widget import WidgetRenderer
+
+RENDERER_TYPE_BY_NAME = {
+    "canvas": CanvasRenderer,
+    "widget": WidgetRenderer,
+}
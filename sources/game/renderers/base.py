@@ -0,0 +1,77 @@
+import tkinter as tk
+from abc import ABC, abstractmethod
+
+
+class Renderer(ABC):
+    """
+    A class that draws a unit onto the canvas: its sprite on a tile of its color
+    and its health bar. Soldiers and buildings delegate every display call to a
+    renderer, so that how units are drawn can be swapped without touching them.
+    """
+
+    def __init__(self, canvas: tk.Canvas, *, maximum_health: float, command=None) -> None:
+        self._canvas = canvas
+        self._maximum_health = maximum_health
+        self._command = command
+
+    @abstractmethod
+    def attach(self, x: int, y: int) -> int:
+        """
+        Draw the unit on (x, y) and return the ID of its main canvas item.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def detach(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def destroy(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def configure(self, *, color: str, cursor: str, image: tk.PhotoImage) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def move_to(self, x: int, y: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_health(self, health: float) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def lift(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def bind(self, sequence: str, func) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def unbind(self, sequence: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def grab_set(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def grab_release(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def start_drag(self, event: tk.Event) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def drag(self, event: tk.Event) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_dragged_coordinate(self) -> tuple:
+        """
+        Return the coordinate of the tile under the center of the dragged sprite.
+        """
+        raise NotImplementedError
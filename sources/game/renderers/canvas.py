@@ -0,0 +1,168 @@
+import itertools
+import tkinter as tk
+
+from game.configuration import Configuration as C
+from game.miscellaneous import get_pixels
+from game.renderers.base import Renderer
+
+
+class CanvasRenderer(Renderer):
+    """
+    A renderer that draws a unit as plain canvas items sharing a tag of their own:
+    a rectangle of the unit's color behind its sprite and two rectangles for its health bar.
+    Pointer events are bound to that tag, and the tile under the pointer is found by arithmetic.
+    """
+
+    # In pixels
+    HALF_TILE_LENGTH = 22.5
+    HALF_HEALTH_BAR_THICKNESS = 2.5
+
+    _counter = itertools.count()
+
+    def __init__(self, canvas: tk.Canvas, *, maximum_health: float, command=None) -> None:
+        super().__init__(canvas, maximum_health=maximum_health, command=command)
+
+        self._tag = f"unit_{next(self._counter)}"
+        self._color = C.GRAY
+        self._cursor = ""
+        self._image = ""
+        self._health = maximum_health
+        self._func_by_sequence = {}
+        self._funcid_by_sequence = {}
+
+        self.bind("<Enter>", self._handle_enter_event)
+        self.bind("<Leave>", self._handle_leave_event)
+        if command:
+            self.bind("<ButtonRelease-1>", self._handle_release_event)
+
+    def attach(self, x: int, y: int) -> int:
+        self._x = x
+        self._y = y
+
+        sprite_x, sprite_y = get_pixels(x, y, y_pixel_shift=5.0)
+        self._tile_id = self._canvas.create_rectangle(
+            sprite_x - self.HALF_TILE_LENGTH,
+            sprite_y - self.HALF_TILE_LENGTH,
+            sprite_x + self.HALF_TILE_LENGTH,
+            sprite_y + self.HALF_TILE_LENGTH,
+            fill=self._color,
+            outline="Black",
+            tags=(self._tag, "unit"),
+        )
+        self._sprite_id = self._canvas.create_image(
+            sprite_x,
+            sprite_y,
+            image=self._image,
+            tags=(self._tag, "unit"),
+        )
+
+        bar_x, bar_y = get_pixels(x, y, y_pixel_shift=-22.5)
+        self._canvas.create_rectangle(
+            bar_x - C.HEALTH_BAR_LENGTH / 2,
+            bar_y - self.HALF_HEALTH_BAR_THICKNESS,
+            bar_x + C.HEALTH_BAR_LENGTH / 2,
+            bar_y + self.HALF_HEALTH_BAR_THICKNESS,
+            fill="Red",
+            width=0,
+            tags=(self._tag, "unit"),
+        )
+        self._health_bar_id = self._canvas.create_rectangle(
+            *self._get_health_bar_coordinates(bar_x, bar_y),
+            fill="Green",
+            width=0,
+            tags=(self._tag, "unit"),
+        )
+
+        return self._sprite_id
+
+    def detach(self) -> None:
+        self._canvas.delete(self._tag)
+        del self._tile_id, self._sprite_id, self._health_bar_id
+
+    def destroy(self) -> None:
+        for sequence in list(self._func_by_sequence):
+            self.unbind(sequence)
+
+    def configure(self, *, color: str, cursor: str, image: tk.PhotoImage) -> None:
+        # Items are created from the current options, so only changes to them need configuring.
+        if hasattr(self, "_sprite_id"):
+            if color != self._color:
+                self._canvas.itemconfigure(self._tile_id, fill=color)
+            if image != self._image:
+                self._canvas.itemconfigure(self._sprite_id, image=image)
+
+        self._color = color
+        self._cursor = cursor
+        self._image = image
+
+    def move_to(self, x: int, y: int) -> None:
+        self._canvas.move(self._tag, (x - self._x) * C.TILE_DIMENSION, (y - self._y) * C.TILE_DIMENSION)
+        self._x = x
+        self._y = y
+
+    def set_health(self, health: float) -> None:
+        if health == self._health:
+            return
+
+        self._health = health
+
+        if hasattr(self, "_health_bar_id"):
+            self._canvas.coords(
+                self._health_bar_id,
+                *self._get_health_bar_coordinates(*get_pixels(self._x, self._y, y_pixel_shift=-22.5)),
+            )
+
+    def lift(self) -> None:
+        self._canvas.tag_raise(self._tag)
+
+    def bind(self, sequence: str, func) -> None:
+        # Every binding creates a Tcl command, which is only deleted when unbound by its id.
+        if self._func_by_sequence.get(sequence) != func:
+            self.unbind(sequence)
+            self._funcid_by_sequence[sequence] = self._canvas.tag_bind(self._tag, sequence, func)
+            self._func_by_sequence[sequence] = func
+
+    def unbind(self, sequence: str) -> None:
+        if self._func_by_sequence.pop(sequence, None):
+            self._canvas.tag_unbind(self._tag, sequence, self._funcid_by_sequence.pop(sequence))
+
+    def grab_set(self) -> None:
+        # The canvas keeps sending pointer events to the pressed item until the button is released.
+        pass
+
+    def grab_release(self) -> None:
+        pass
+
+    def start_drag(self, event: tk.Event) -> None:
+        self._dragged_x = event.x
+        self._dragged_y = event.y
+
+    def drag(self, event: tk.Event) -> None:
+        self._canvas.move(self._tag, event.x - self._dragged_x, event.y - self._dragged_y)
+        self._dragged_x = event.x
+        self._dragged_y = event.y
+
+    def get_dragged_coordinate(self) -> tuple:
+        x, y = self._canvas.coords(self._sprite_id)
+        return int(x // C.TILE_DIMENSION), int(y // C.TILE_DIMENSION)
+
+    def _get_health_bar_coordinates(self, bar_x: float, bar_y: float) -> tuple:
+        return (
+            bar_x - C.HEALTH_BAR_LENGTH / 2,
+            bar_y - self.HALF_HEALTH_BAR_THICKNESS,
+            bar_x + C.HEALTH_BAR_LENGTH * (self._health / self._maximum_health - 0.5),
+            bar_y + self.HALF_HEALTH_BAR_THICKNESS,
+        )
+
+    def _handle_enter_event(self, event: tk.Event) -> None:
+        self._canvas.configure(cursor=self._cursor)
+
+    def _handle_leave_event(self, event: tk.Event) -> None:
+        self._canvas.configure(cursor="")
+
+    def _handle_release_event(self, event: tk.Event) -> None:
+        # Behave like a button: only a release over the unit's own tile counts as a click.
+        x = int(self._canvas.canvasx(event.x) // C.TILE_DIMENSION)
+        y = int(self._canvas.canvasy(event.y) // C.TILE_DIMENSION)
+        if (x, y) == (self._x, self._y):
+            self._command()
@@ -0,0 +1,122 @@
+import tkinter as tk
+from tkinter import ttk
+
+from game.configuration import Configuration as C
+from game.miscellaneous import get_pixels
+from game.renderers.base import Renderer
+
+
+class WidgetRenderer(Renderer):
+    """
+    A renderer that embeds a ttk widget and a ttk progress bar into the canvas.
+    The options and bindings last handed over to the widgets are kept, so that
+    only those that change are configured again.
+    """
+
+    def __init__(self, canvas: tk.Canvas, *, maximum_health: float, command=None) -> None:
+        super().__init__(canvas, maximum_health=maximum_health, command=command)
+
+        if command:
+            self._main_widget = ttk.Button(self._canvas, command=command, takefocus=False)
+        else:
+            self._main_widget = ttk.Label(self._canvas)
+
+        self._health_bar = ttk.Progressbar(
+            self._canvas,
+            length=C.HEALTH_BAR_LENGTH,
+            maximum=maximum_health,
+            mode="determinate",
+            orient=tk.HORIZONTAL,
+            style="Green_Red.Horizontal.TProgressbar",
+            value=maximum_health,
+        )
+
+        self._options = {}
+        self._health = maximum_health
+        self._func_by_sequence = {}
+
+    def attach(self, x: int, y: int) -> int:
+        self._main_widget_id = self._canvas.create_window(
+            *get_pixels(x, y, y_pixel_shift=5.0),
+            window=self._main_widget,
+        )
+        self._health_bar_id = self._canvas.create_window(
+            *get_pixels(x, y, y_pixel_shift=-22.5),
+            window=self._health_bar,
+        )
+        return self._main_widget_id
+
+    def detach(self) -> None:
+        self._canvas.delete(self._health_bar_id)
+        del self._health_bar_id
+        self._canvas.delete(self._main_widget_id)
+        del self._main_widget_id
+
+    def destroy(self) -> None:
+        self._health_bar.destroy()
+        del self._health_bar
+        self._main_widget.destroy()
+        del self._main_widget
+
+    def configure(self, *, color: str, cursor: str, image: tk.PhotoImage) -> None:
+        color_name = C.COLOR_NAME_BY_HEX_TRIPLET[color]
+        options = {
+            "cursor": cursor,
+            "image": image,
+            "style": f"Custom{color_name.capitalize()}.TButton",
+        }
+        if changed_options := {key: value for key, value in options.items() if self._options.get(key) != value}:
+            self._main_widget.configure(**changed_options)
+            self._options.update(changed_options)
+
+    def move_to(self, x: int, y: int) -> None:
+        self._canvas.coords(self._main_widget_id, *get_pixels(x, y, y_pixel_shift=5.0))
+        self._canvas.coords(self._health_bar_id, *get_pixels(x, y, y_pixel_shift=-22.5))
+
+    def set_health(self, health: float) -> None:
+        if health != self._health:
+            self._health_bar["value"] = health
+            self._health = health
+
+    def lift(self) -> None:
+        self._main_widget.lift()
+        self._health_bar.lift()
+
+    def bind(self, sequence: str, func) -> None:
+        # Every binding creates a Tcl command, which lives as long as the widget.
+        if self._func_by_sequence.get(sequence) != func:
+            self._main_widget.bind(sequence, func)
+            self._func_by_sequence[sequence] = func
+
+    def unbind(self, sequence: str) -> None:
+        if self._func_by_sequence.pop(sequence, None):
+            self._main_widget.unbind(sequence)
+
+    def grab_set(self) -> None:
+        self._main_widget.grab_set()
+
+    def grab_release(self) -> None:
+        self._main_widget.grab_release()
+
+    def start_drag(self, event: tk.Event) -> None:
+        # Event coordinates are relative to the widget, which moves along with the pointer.
+        self._pressed_x = event.x
+        self._pressed_y = event.y
+
+    def drag(self, event: tk.Event) -> None:
+        dx = event.x - self._pressed_x
+        dy = event.y - self._pressed_y
+
+        self._main_widget.place(
+            x=self._main_widget.winfo_x() + dx,
+            y=self._main_widget.winfo_y() + dy,
+        )
+        self._health_bar.place(
+            x=self._health_bar.winfo_x() + dx,
+            y=self._health_bar.winfo_y() + dy,
+        )
+
+    def get_dragged_coordinate(self) -> tuple:
+        x = self._canvas.canvasx(self._main_widget.winfo_x() + self._main_widget.winfo_width() / 2)
+        y = self._canvas.canvasy(self._main_widget.winfo_y() + self._main_widget.winfo_height() / 2)
+        return int(x // C.TILE_DIMENSION), int(y // C.TILE_DIMENSION)
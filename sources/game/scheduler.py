@@ -0,0 +1,112 @@
+import heapq
+import itertools
+import logging
+import tkinter as tk
+from time import perf_counter
+
+from game.configuration import Configuration as C
+
+logger = logging.getLogger(__name__)
+
+
+class Scheduler:
+    """
+    A class that runs generator-based tasks on the Tk event loop for the
+    window of a session. A task yields None to be resumed as soon as possible,
+    or a number of milliseconds to sleep for. Tasks are resumed within a time
+    budget per frame, so the window keeps redrawing and handling events in
+    between. A task that raises is dropped without stopping the others.
+    """
+
+    def __init__(self, widget: tk.Misc) -> None:
+        self._widget = widget
+        self._after_id = None
+        self._counter = itertools.count()
+        self._tasks = []
+
+        self.frame_count = 0
+        self.busy_time = 0.0
+        self.longest_frame_time = 0.0
+
+    def spawn(self, task) -> None:
+        heapq.heappush(self._tasks, (perf_counter(), next(self._counter), task))
+        self._schedule_frame()
+
+    def is_idle(self) -> bool:
+        return not self._tasks
+
+    def _schedule_frame(self) -> None:
+        if self._after_id or not self._tasks:
+            return
+
+        # Wait at least a millisecond so that pending events get handled in between.
+        delay = max(1, round((self._tasks[0][0] - perf_counter()) * 1000))
+        self._after_id = self._widget.after(delay, self._run_frame)
+
+    def _run_frame(self) -> None:
+        self._after_id = None
+        start = perf_counter()
+        deadline = start + C.FRAME_BUDGET / 1000
+
+        while self._tasks:
+            now = perf_counter()
+            wake_time, _, task = self._tasks[0]
+            if wake_time > now or now >= deadline:
+                break
+
+            heapq.heappop(self._tasks)
+            try:
+                delay = next(task)
+            except StopIteration:
+                continue
+            except Exception:
+                logger.exception("A scheduled task has failed")
+                continue
+
+            heapq.heappush(self._tasks, (now + (delay or 0) / 1000, next(self._counter), task))
+
+        # Redraw whatever the tasks have changed before the next frame.
+        self._widget.update_idletasks()
+
+        elapsed = perf_counter() - start
+        self.frame_count += 1
+        self.busy_time += elapsed
+        self.longest_frame_time = max(self.longest_frame_time, elapsed)
+
+        self._schedule_frame()
+
+
+class RedrawScheduler:
+    """
+    A class that redraws the game objects of a session marked dirty in a single
+    pass once the event loop is idle, however many times each of them has been
+    marked. Objects redraw themselves from the state of the game, and hand over
+    to Tk only what has changed since they were last drawn.
+    """
+
+    def __init__(self, widget: tk.Misc) -> None:
+        self._widget = widget
+        self._after_id = None
+        self._dirty_objects = {}
+
+    def mark_dirty(self, obj) -> None:
+        self._dirty_objects[obj] = None
+        if not self._after_id:
+            self._after_id = self._widget.after_idle(self._redraw)
+
+    def discard(self, obj) -> None:
+        self._dirty_objects.pop(obj, None)
+
+    def flush(self) -> None:
+        """
+        Redraw the game objects marked dirty right away rather than once the event loop is idle.
+        """
+        if self._after_id:
+            self._widget.after_cancel(self._after_id)
+        self._redraw()
+
+    def _redraw(self) -> None:
+        self._after_id = None
+        dirty_objects, self._dirty_objects = self._dirty_objects, {}
+        for obj in dirty_objects:
+            obj.refresh_widgets()
@@ -1,12 +1,6 @@
+from game.engine import units
 from game.soldiers.base import Soldier
 
 
-class Cavalry(Soldier):
-
-    attack_multipliers = {
-        "Archer": 1.5,
-        "Hero": 0.7,
-        "Infantry": 0.7,
-    }
-
-    mobility = 3
+class Cavalry(Soldier, units.Cavalry):
+    pass
@@ -1,45 +1,83 @@
+from game.miscellaneous import InputLock
+from game.profiler import Profiler
+from game.scheduler import RedrawScheduler, Scheduler
+
+
 class GameState:
 
-    day = 1
-    wave = 0
-    coin = 10
-    occupied_coordinates = set()
-    pressed_game_object = None
-    selected_game_objects = []
+    def __init__(self, world) -> None:
+        self.world = world
+        self.pressed_game_object = None
+        self.selected_game_objects = []
 
 
-class BuildingState:
+class AnimationState:
 
-    critical_buildings = set()
-    noncritical_buildings = set()
+    def __init__(self, speed: str = "normal") -> None:
+        self.speed = speed
 
 
 class ControlState:
 
-    display_outcome_control = None
-    end_turn_control = None
+    def __init__(self) -> None:
+        self.display_outcome_control = None
+        self.end_turn_control = None
 
 
 class DisplayState:
 
-    coin_display = None
-    day_display = None
-    stat_display = None
+    def __init__(self) -> None:
+        self.coin_display = None
+        self.day_display = None
+        self.stat_display = None
 
 
 class HighlightState:
 
-    attack_range_highlight = None
-    movement_highlights = set()
-    placement_highlights = set()
+    def __init__(self) -> None:
+        self.attack_range_highlight = None
+        self.movement_highlights = set()
+        self.placement_highlights = set()
+        self.pool_by_type = {}
 
 
-class RecruitmentState:
+class RenderState:
+
+    def __init__(self, renderer: str = "widget") -> None:
+        self.renderer = renderer
 
-    barrack_recruitments = set()
 
+class ViewState:
 
-class SoldierState:
+    def __init__(self) -> None:
+        self.sidebar = None
+        self.viewport = None
+
+
+class RecruitmentState:
 
-    allied_soldiers = set()
-    enemy_soldiers = set()
+    def __init__(self) -> None:
+        self.barrack_recruitments = set()
+
+
+class Session:
+    """
+    A class that holds the state of a game played in a window: its world, the
+    widgets showing it and the schedulers running on window. Every game object
+    belongs to a session, so that games hosted by the same process share nothing
+    but the images, styles and the event loop.
+    """
+
+    def __init__(self, world, window, *, animation_speed: str = "normal", renderer: str = "widget") -> None:
+        self.game = GameState(world)
+        self.animation = AnimationState(animation_speed)
+        self.control = ControlState()
+        self.display = DisplayState()
+        self.highlight = HighlightState()
+        self.render = RenderState(renderer)
+        self.view = ViewState()
+        self.recruitment = RecruitmentState()
+        self.input_lock = InputLock()
+        self.scheduler = Scheduler(window)
+        self.redraw_scheduler = RedrawScheduler(window)
+        self.profiler = Profiler()
@@ -0,0 +1,127 @@
+import tkinter as tk
+from itertools import chain
+
+from game.configuration import Configuration as C
+from game.states import Session
+
+
+class Viewport:
+    """
+    A class that scrolls the canvas over the board and keeps canvas items only
+    for what can be seen: the landscape is composed in square chunks of tiles,
+    and units are attached to or detached from the canvas as they come into or
+    go out of view.
+    """
+
+    CHUNK_TILE_COUNT = 8
+
+    def __init__(self, session: Session, canvas: tk.Canvas, *, lands: tuple, land_indices: bytes) -> None:
+        self._session = session
+        self.canvas = canvas
+        self._lands = lands
+        self._land_indices = land_indices
+
+        board = self._session.game.world.board
+        self.horizontal_tile_count = min(board.width, C.HORIZONTAL_LAND_TILE_COUNT)
+        self.vertical_tile_count = min(board.height, C.VERTICAL_TILE_COUNT)
+
+        self._chunk_by_origin = {}
+
+        self.canvas.configure(
+            scrollregion=(0, 0, C.TILE_DIMENSION * board.width, C.TILE_DIMENSION * board.height),
+            xscrollincrement=C.TILE_DIMENSION,
+            yscrollincrement=C.TILE_DIMENSION,
+        )
+
+    def get_visible_area(self) -> tuple:
+        """
+        Return the coordinates of the top left visible tile and the bottom right one.
+        """
+        x = int(self.canvas.canvasx(0) // C.TILE_DIMENSION)
+        y = int(self.canvas.canvasy(0) // C.TILE_DIMENSION)
+        return x, y, x + self.horizontal_tile_count - 1, y + self.vertical_tile_count - 1
+
+    def scroll(self, axis: str, *args) -> None:
+        """
+        Scroll along axis ("x" or "y") as a scrollbar would, then refresh.
+        """
+        match axis:
+            case "x":
+                self.canvas.xview(*args)
+            case "y":
+                self.canvas.yview(*args)
+
+        self.refresh()
+
+    def center_on(self, x: int, y: int) -> None:
+        board = self._session.game.world.board
+        self.canvas.xview_moveto((x - self.horizontal_tile_count // 2) / board.width)
+        self.canvas.yview_moveto((y - self.vertical_tile_count // 2) / board.height)
+        self.refresh()
+
+    def refresh(self) -> None:
+        self._refresh_landscape()
+        self.refresh_units()
+
+    def refresh_units(self) -> None:
+        """
+        Attach the units in view and detach those out of view.
+        """
+        x0, y0, x1, y1 = self.get_visible_area()
+        world = self._session.game.world
+        for unit in chain(
+            world.allied_soldiers,
+            world.enemy_soldiers,
+            world.critical_buildings,
+            world.noncritical_buildings,
+        ):
+            visible = x0 <= unit.x <= x1 and y0 <= unit.y <= y1
+            attached = hasattr(unit, "_main_widget_id")
+            if visible and not attached:
+                unit.attach_widgets_to_canvas()
+            elif attached and not visible and unit is not self._session.game.pressed_game_object:
+                unit.detach_widgets_from_canvas()
+
+    def _refresh_landscape(self) -> None:
+        x0, y0, x1, y1 = self.get_visible_area()
+        n = self.CHUNK_TILE_COUNT
+        origins = {
+            (x, y)
+            for x in range(x0 - x0 % n, x1 + 1, n)
+            for y in range(y0 - y0 % n, y1 + 1, n)
+        }
+
+        for origin in set(self._chunk_by_origin) - origins:
+            image, image_id = self._chunk_by_origin.pop(origin)
+            self.canvas.delete(image_id)
+
+        for origin in origins - set(self._chunk_by_origin):
+            image = self._compose_chunk(*origin)
+            image_id = self.canvas.create_image(
+                C.TILE_DIMENSION * origin[0],
+                C.TILE_DIMENSION * origin[1],
+                anchor=tk.NW,
+                image=image,
+                tags="landscape",
+            )
+            self.canvas.tag_lower(image_id)
+            self._chunk_by_origin[origin] = (image, image_id)
+
+    def _compose_chunk(self, x0: int, y0: int) -> tk.PhotoImage:
+        """
+        Copy the tiles of the chunk whose top left tile is (x0, y0) into one image.
+        """
+        board = self._session.game.world.board
+        image = tk.PhotoImage(
+            width=C.TILE_DIMENSION * min(self.CHUNK_TILE_COUNT, board.width - x0),
+            height=C.TILE_DIMENSION * min(self.CHUNK_TILE_COUNT, board.height - y0),
+        )
+
+        for y in range(y0, min(y0 + self.CHUNK_TILE_COUNT, board.height)):
+            for x in range(x0, min(x0 + self.CHUNK_TILE_COUNT, board.width)):
+                land = self._lands[self._land_indices[board.index(x, y)]]
+                self.canvas.tk.call(
+                    image, "copy", land, "-to", C.TILE_DIMENSION * (x - x0), C.TILE_DIMENSION * (y - y0),
+                )
+
+        return image
@@ -3,52 +3,118 @@
 """
 
 
+import json
+import mmap
 import sys
 import tkinter as tk
-from random import choices
+from argparse import ArgumentParser
+from pathlib import Path
+from tkinter import ttk
 
-from game.buildings import Barrack
+from game.buildings import Barrack, Wall
+from game.configuration import Configuration as C
 from game.controls import EndTurnControl
-from game.displays import CoinDisplay, DayDisplay, StatDisplay
-from game.miscellaneous import Configuration as C
+from game.displays import CoinDisplay, DayDisplay, LatencyDisplay, StatDisplay
+from game.engine import Simulation, World
+from game.engine.replay import ActionLog
+from game.engine.snapshot import read_snapshot, restore_unit, save_snapshot
+from game.engine.tournament import run_tournament
+from game.highlights import MovementHighlight, PlacementHighlight
 from game.miscellaneous import Environment as E
-from game.miscellaneous import Image, Style, get_pixels
-from game.soldiers import Hero
+from game.miscellaneous import Image, Style
+from game.monitor import LatencyMonitor
+from game.profiler import Profiler
+from game.renderers import RENDERER_TYPE_BY_NAME
+from game.soldiers import Archer, Cavalry, Hero, Infantry
+from game.states import Session
+from game.viewport import Viewport
+
+UNIT_TYPE_BY_NAME = {
+    unit_type.__name__: unit_type for unit_type in (Archer, Barrack, Cavalry, Hero, Infantry, Wall)
+}
 
 
 class Program:
 
-    def __init__(self) -> None:
-        self._window = tk.Tk()
+    def __init__(
+        self,
+        width: int = C.HORIZONTAL_LAND_TILE_COUNT,
+        height: int = C.VERTICAL_TILE_COUNT,
+        seed: int | None = None,
+        snapshot=None,
+        *,
+        animation_speed: str = "normal",
+        renderer: str = "widget",
+        latency_overlay: bool = False,
+        master: tk.Misc | None = None,
+    ) -> None:
+        if snapshot is None:
+            world = World(width, height, seed)
+        else:
+            world, unit_records = read_snapshot(snapshot)
+            width, height = world.width, world.height
+
+        if master is None:
+            self._window = tk.Tk()
+            if Profiler.enabled:
+                Profiler.attach(self._window)
+        else:
+            # Another game shares the interpreter of master, along with its images, styles and event loop.
+            self._window = tk.Toplevel(master)
+        self.session = Session(world, self._window, animation_speed=animation_speed, renderer=renderer)
         self._detect_environment()
         self._check_requirements()
         self._window.title("TkTactics")
         self._window.resizable(width=False, height=False)
 
+        # The board is seen through a viewport of at most the default board size.
         self._canvas = tk.Canvas(
             self._window,
-            width=C.TILE_DIMENSION * C.HORIZONTAL_TILE_COUNT,
+            width=C.TILE_DIMENSION * min(width, C.HORIZONTAL_LAND_TILE_COUNT),
+            height=C.TILE_DIMENSION * C.VERTICAL_TILE_COUNT,
+            background="Black",
+            highlightthickness=0,
+        )
+        self._canvas.grid(row=0, column=0)
+
+        self._sidebar = tk.Canvas(
+            self._window,
+            width=C.TILE_DIMENSION * (C.HORIZONTAL_SHORE_TILE_COUNT + C.HORIZONTAL_OCEAN_TILE_COUNT),
             height=C.TILE_DIMENSION * C.VERTICAL_TILE_COUNT,
             background="Black",
             highlightthickness=0,
         )
-        self._canvas.pack()
+        self._sidebar.grid(row=0, column=2)
+        self.session.view.sidebar = self._sidebar
 
         Image.initialize()
         Style.initialize()
 
         self._create_landscape()
-        self._create_displays()
+        self._create_scrollbars()
+        self._create_sidebar_background()
+        self._create_displays(latency_overlay)
         self._create_controls()
+        self._preload_highlights()
 
-        self._create_initial_buildings()
-        self._create_initial_allied_soldiers()
+        if snapshot is None:
+            self._create_initial_buildings()
+            self._create_initial_allied_soldiers()
+        else:
+            self._restore_units(unit_records)
+        self.session.view.viewport.center_on(width // 2, height // 2)
 
-        self._window.mainloop()
+        self._preload_images()
+
+        # Whoever created master runs its event loop.
+        if master is None:
+            LatencyMonitor.start(self._window)
+            try:
+                self._window.mainloop()
+            finally:
+                LatencyMonitor.stop()
 
     def _detect_environment(self) -> None:
-        E.SCREEN_HEIGHT = self._window.winfo_screenheight()
-        E.SCREEN_WIDTH = self._window.winfo_screenwidth()
         E.TCL_TK_VERSION = self._window.call("info", "patchlevel")
         E.WINDOWING_SYSTEM = self._window.call("tk", "windowingsystem")
 
@@ -62,63 +128,263 @@ class Program:
             Image.rock,
             Image.tree,
         ])
-        WEIGHTS = (56, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 15, 15)
 
-        # TODO: Track canvas image object ID.
-        for y in range(C.VERTICAL_TILE_COUNT):
-            for x in range(C.HORIZONTAL_LAND_TILE_COUNT):
-                self._canvas.create_image(
-                    *get_pixels(x, y),
-                    image=choices(LANDS, weights=WEIGHTS)[0],
-                )
+        # Only the chunks of the landscape in view are composed and placed onto the canvas.
+        self.session.view.viewport = Viewport(
+            self.session,
+            self._canvas,
+            lands=LANDS,
+            land_indices=bytes(self.session.game.world.board.lands),
+        )
 
-            for _ in range(C.HORIZONTAL_SHORE_TILE_COUNT):
-                x += 1
-                self._canvas.create_image(*get_pixels(x, y), image=Image.ocean)
+    def _create_scrollbars(self) -> None:
+        viewport = self.session.view.viewport
+        board = self.session.game.world.board
 
-            for _ in range(C.HORIZONTAL_OCEAN_TILE_COUNT):
-                x += 1
-                self._canvas.create_image(*get_pixels(x, y), image=Image.ocean)
+        if board.width > viewport.horizontal_tile_count:
+            scrollbar = ttk.Scrollbar(
+                self._window,
+                command=lambda *args: viewport.scroll("x", *args),
+                orient=tk.HORIZONTAL,
+            )
+            scrollbar.grid(row=1, column=0, sticky=tk.EW)
+            self._canvas.configure(xscrollcommand=scrollbar.set)
+            self._window.bind("<Left>", lambda event: viewport.scroll("x", "scroll", -1, "units"))
+            self._window.bind("<Right>", lambda event: viewport.scroll("x", "scroll", 1, "units"))
 
-    def _create_displays(self) -> None:
-        DayDisplay(
-            self._canvas,
-            C.HORIZONTAL_LAND_TILE_COUNT + C.HORIZONTAL_SHORE_TILE_COUNT,
-            0,
-        )
-        CoinDisplay(
-            self._canvas,
-            C.HORIZONTAL_LAND_TILE_COUNT + C.HORIZONTAL_SHORE_TILE_COUNT,
-            1,
-        )
-        StatDisplay(
-            self._canvas,
-            C.HORIZONTAL_LAND_TILE_COUNT + C.HORIZONTAL_SHORE_TILE_COUNT,
-            5,
+        if board.height > viewport.vertical_tile_count:
+            scrollbar = ttk.Scrollbar(
+                self._window,
+                command=lambda *args: viewport.scroll("y", *args),
+                orient=tk.VERTICAL,
+            )
+            scrollbar.grid(row=0, column=1, sticky=tk.NS)
+            self._canvas.configure(yscrollcommand=scrollbar.set)
+            self._window.bind("<Up>", lambda event: viewport.scroll("y", "scroll", -1, "units"))
+            self._window.bind("<Down>", lambda event: viewport.scroll("y", "scroll", 1, "units"))
+
+    def _create_sidebar_background(self) -> None:
+        self._sidebar_background = tk.PhotoImage(
+            width=C.TILE_DIMENSION * (C.HORIZONTAL_SHORE_TILE_COUNT + C.HORIZONTAL_OCEAN_TILE_COUNT),
+            height=C.TILE_DIMENSION * C.VERTICAL_TILE_COUNT,
         )
 
+        for y in range(C.VERTICAL_TILE_COUNT):
+            for x in range(C.HORIZONTAL_SHORE_TILE_COUNT + C.HORIZONTAL_OCEAN_TILE_COUNT):
+                self._window.tk.call(
+                    self._sidebar_background, "copy", Image.ocean,
+                    "-to", C.TILE_DIMENSION * x, C.TILE_DIMENSION * y,
+                )
+
+        self._sidebar.create_image(0, 0, anchor=tk.NW, image=self._sidebar_background)
+
+    def _create_displays(self, latency_overlay: bool) -> None:
+        DayDisplay(self.session, self._sidebar, C.HORIZONTAL_SHORE_TILE_COUNT, 0)
+        CoinDisplay(self.session, self._sidebar, C.HORIZONTAL_SHORE_TILE_COUNT, 1)
+        StatDisplay(self.session, self._sidebar, C.HORIZONTAL_SHORE_TILE_COUNT, 5)
+        if latency_overlay and LatencyMonitor.enabled:
+            # The lags of the event loop are shown above the End turn control, clear of the stats.
+            LatencyDisplay(self.session, self._sidebar, C.HORIZONTAL_SHORE_TILE_COUNT, C.VERTICAL_TILE_COUNT - 3)
+
     def _create_controls(self) -> None:
-        EndTurnControl(
-            self._canvas,
-            C.HORIZONTAL_LAND_TILE_COUNT + C.HORIZONTAL_SHORE_TILE_COUNT,
-            C.VERTICAL_TILE_COUNT - 1,
-        )
+        EndTurnControl(self.session, self._sidebar, C.HORIZONTAL_SHORE_TILE_COUNT, C.VERTICAL_TILE_COUNT - 1)
+
+    def _preload_highlights(self) -> None:
+        # A soldier with mobility 3 can reach up to 24 tiles and a barrack has 8 neighbors.
+        MovementHighlight.preload(self.session, self._canvas, 24)
+        PlacementHighlight.preload(self.session, self._canvas, 8)
+
+    def _preload_images(self) -> None:
+        # Decode the sprites the first waves are likely to need while the player is idle.
+        Image.preload(self._window, [
+            *(
+                f"{color_name}_{soldier_name}_1"
+                for color_name in ("blue", "gray", "red")
+                for soldier_name in ("archer", "cavalry", "infantry")
+            ),
+            *("red_diamond_{0}x{0}".format(half_diagonal * 120) for half_diagonal in range(1, 4)),
+        ])
 
     def _create_initial_buildings(self) -> None:
         Barrack(
+            self.session,
             self._canvas,
-            C.HORIZONTAL_LAND_TILE_COUNT // 2,
-            C.VERTICAL_TILE_COUNT // 2,
+            self.session.game.world.width // 2,
+            self.session.game.world.height // 2,
         )
 
     def _create_initial_allied_soldiers(self) -> None:
         Hero(
+            self.session,
             self._canvas,
-            C.HORIZONTAL_LAND_TILE_COUNT // 2,
-            C.VERTICAL_TILE_COUNT // 2 + 1,
+            self.session.game.world.width // 2,
+            self.session.game.world.height // 2 + 1,
             color=C.BLUE,
         )
 
+    def _restore_units(self, unit_records: list) -> None:
+        # Units are created off the canvas, and the viewport attaches those in view afterwards.
+        for record in unit_records:
+            type_name, color, x, y, *_ = record
+            if color is None:
+                unit = UNIT_TYPE_BY_NAME[type_name](self.session, self._canvas, x, y, attach=False)
+            else:
+                unit = UNIT_TYPE_BY_NAME[type_name](self.session, self._canvas, x, y, color=color, attach=False)
+            restore_unit(unit, record)
+            unit.refresh_widgets()
+
 
 if __name__ == "__main__":
-    program = Program()
+    parser = ArgumentParser(description="Play TkTactics.")
+    parser.add_argument(
+        "--animation-speed",
+        choices=C.ANIMATION_FRAME_DURATION_BY_SPEED,
+        default="normal",
+        help="how long the moves of the computer turn are shown",
+    )
+    parser.add_argument(
+        "--renderer",
+        choices=RENDERER_TYPE_BY_NAME,
+        default="widget",
+        help="whether units are drawn as embedded widgets or as plain canvas items",
+    )
+    parser.add_argument(
+        "--width",
+        default=C.HORIZONTAL_LAND_TILE_COUNT,
+        type=int,
+        help="how many tiles the board spans horizontally",
+    )
+    parser.add_argument(
+        "--height",
+        default=C.VERTICAL_TILE_COUNT,
+        type=int,
+        help="how many tiles the board spans vertically",
+    )
+    parser.add_argument(
+        "--load",
+        type=Path,
+        help="continue the game saved by --save instead of starting a new one",
+    )
+    parser.add_argument(
+        "--save",
+        type=Path,
+        help="where to save the game once the window is closed, to be continued with --load",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        help="where to save the time spent in every phase of the computer turns and the calls made to Tk, as JSON",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        help="where to save the phases of the computer turns as a trace for flame graph viewers",
+    )
+    parser.add_argument(
+        "--latency-overlay",
+        action="store_true",
+        help="show how late the event loop handles a regular heartbeat, in milliseconds",
+    )
+    parser.add_argument(
+        "--latency",
+        type=Path,
+        help="where to save the histogram of the lags of the event loop, as JSON",
+    )
+    parser.add_argument(
+        "--games",
+        type=int,
+        help="play this many games without a window, both armies commanded by the computer, and report on them",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="the seed of the game, or of the first of the games played without a window, which count up from it",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="how many processes play the games without a window (default: one per core)",
+    )
+    parser.add_argument(
+        "--record",
+        type=Path,
+        help="where to save the actions taken in the game, along with its seed, once the window is closed",
+    )
+    parser.add_argument(
+        "--replay",
+        type=Path,
+        help="play the game recorded by --record again without a window and report on it",
+    )
+    parser.add_argument(
+        "--max-turns",
+        default=1000,
+        type=int,
+        help="after how many turns a game played without a window is left undecided",
+    )
+    args = parser.parse_args()
+    if min(args.width, args.height) < C.MINIMUM_LAND_TILE_COUNT:
+        parser.error(f"the board must span at least {C.MINIMUM_LAND_TILE_COUNT} tiles in each direction")
+    # Seeds are saved as signed 64-bit integers by --record and --save.
+    if args.seed is not None and not 0 <= args.seed < 2 ** 63:
+        parser.error("the seed must lie between 0 and 2 ** 63 - 1")
+
+    if args.games is not None:
+        if args.games < 1:
+            parser.error("at least one game must be played")
+
+        report = run_tournament(
+            args.games,
+            seed=args.seed or 0,
+            worker_count=args.workers,
+            width=args.width,
+            height=args.height,
+            max_turns=args.max_turns,
+        )
+        print(
+            f"{report['games']} games on {report['workers']} workers in {report['seconds']:.2f} s\n"
+            f"win rate             {report['win_rate']:9.1%}\n"
+            f"undecided            {report['undecided_rate']:9.1%}\n"
+            f"turns survived       {report['mean_turns']:9.1f}\n"
+            f"allies lost          {report['mean_allies_lost']:9.1f}\n"
+            f"enemies killed       {report['mean_enemies_killed']:9.1f}\n"
+            f"games per second     {report['games_per_second']:9.2f}\n"
+            f"  per core           {report['games_per_second_per_core']:9.2f}"
+        )
+        sys.exit()
+
+    if args.replay is not None:
+        simulation = Simulation.replay(ActionLog.from_bytes(args.replay.read_bytes()))
+        print(
+            f"seed {simulation.world.seed} on a {simulation.world.width}x{simulation.world.height} board\n"
+            f"outcome              {simulation.outcome or 'undecided'}\n"
+            f"turns                {simulation.turn}\n"
+            f"allies lost          {simulation.allies_lost}\n"
+            f"enemies killed       {simulation.enemies_killed}"
+        )
+        sys.exit()
+
+    Profiler.enabled = args.profile is not None or args.trace is not None
+    LatencyMonitor.enabled = args.latency_overlay or args.latency is not None
+    options = {
+        "animation_speed": args.animation_speed,
+        "renderer": args.renderer,
+        "latency_overlay": args.latency_overlay,
+    }
+    if args.load is None:
+        program = Program(args.width, args.height, args.seed, **options)
+    else:
+        # The snapshot is only read as far as it is needed, straight from the page cache.
+        with open(args.load, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as snapshot:
+            program = Program(snapshot=snapshot, **options)
+
+    world = program.session.game.world
+    if args.save is not None:
+        args.save.write_bytes(save_snapshot(world))
+    if args.record is not None:
+        args.record.write_bytes(world.action_log.to_bytes())
+    if args.profile is not None:
+        args.profile.write_text(json.dumps(program.session.profiler.to_json(), indent=2))
+    if args.trace is not None:
+        args.trace.write_text(json.dumps(program.session.profiler.to_trace()))
+    if args.latency is not None:
+        args.latency.write_text(json.dumps(LatencyMonitor.to_json(), indent=2))
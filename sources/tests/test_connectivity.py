@@ -0,0 +1,86 @@
+import random
+import unittest
+from collections import deque
+
+from game.configuration import Configuration as C
+from game.engine import World, units
+
+MARGINS = (0, 1)
+
+
+def flood_fill(board, margin: int, i: int) -> set:
+    """
+    Return the vacant tiles connected to tile i for soldiers that keep margin tiles away from the edge.
+    """
+    neighbors = board.get_neighbors(margin)
+    tiles = {i}
+    queue = deque([i])
+    while queue:
+        j = queue.popleft()
+        for k in neighbors[j]:
+            if k not in tiles and not board.occupancy[k]:
+                tiles.add(k)
+                queue.append(k)
+
+    return tiles
+
+
+class TestConnectedComponents(unittest.TestCase):
+
+    def test_labels_match_flood_fills_after_edits(self) -> None:
+        for seed in range(30):
+            rng = random.Random(seed)
+            width, height = rng.randint(7, 25), rng.randint(7, 20)
+            world = World(width, height, seed)
+            board = world.board
+            for margin in MARGINS:
+                world.components.get(margin)
+
+            walls = {}
+            for _ in range(80):
+                x, y = rng.randrange(width), rng.randrange(height)
+                if (x, y) in walls:
+                    walls.pop((x, y)).perish()
+                else:
+                    walls[(x, y)] = units.Wall(world, x, y)
+
+                for margin in MARGINS:
+                    components = []
+                    for i in range(width * height):
+                        if (
+                            not board.occupancy[i]
+                            and board.contains(i % width, i // width, margin)
+                            and not any(i in component for component in components)
+                        ):
+                            components.append(flood_fill(board, margin, i))
+
+                    tiles_by_label = {}
+                    for i, label in enumerate(world.components.get(margin).labels):
+                        tiles_by_label.setdefault(label, set()).add(i)
+                    unlabelled = tiles_by_label.pop(0, set())
+
+                    self.assertCountEqual(tiles_by_label.values(), components)
+                    self.assertEqual(len(unlabelled) + sum(map(len, components)), width * height)
+
+    def test_hunter_approaches_unreachable_target_as_closely_as_possible(self) -> None:
+        world = World(15, 11, 0)
+        target = units.Infantry(world, 10, 5, color=C.BLUE)
+        # The target is walled in on a square ring two tiles away, open nowhere.
+        for x in range(8, 13):
+            for y in range(3, 8):
+                if max(abs(x - 10), abs(y - 5)) == 2:
+                    units.Wall(world, x, y)
+        hunter = units.Infantry(world, 1, 5, color=C.RED)
+
+        reachable = flood_fill(world.board, hunter.margin, 5 * 15 + 1)
+        closest = min(abs(i % 15 - target.x) + abs(i // 15 - target.y) for i in reachable)
+
+        for _ in range(10):
+            path = hunter._get_approaching_path(target)
+            hunter.move_to(*path[-1])
+
+        self.assertEqual(abs(hunter.x - target.x) + abs(hunter.y - target.y), closest)
+
+
+if __name__ == "__main__":
+    unittest.main()
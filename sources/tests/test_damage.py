@@ -0,0 +1,78 @@
+import unittest
+
+from game.configuration import Configuration as C
+from game.engine import World, units
+
+UNIT_TYPES = (units.Archer, units.Barrack, units.Cavalry, units.Hero, units.Infantry, units.Wall)
+LEVELS = range(1, len(units.LEVEL_UP_EXPERIENCE_BY_LEVEL) + 2)
+
+
+def get_stats(unit_type: type, level: int) -> tuple:
+    """
+    Return the attack and defense of unit_type at level, grown one promotion at a time.
+    """
+    attack = getattr(unit_type, "attack", 0.0)
+    defense = unit_type.defense
+    for _ in range(level - 1):
+        attack *= 1.2
+        defense += 0.05
+
+    return attack, defense
+
+
+def create_units(world: World, level: int) -> list:
+    """
+    Place a unit of every type at level in world.
+    """
+    created = []
+    for x, unit_type in enumerate(UNIT_TYPES, start=1):
+        if issubclass(unit_type, units.Soldier):
+            unit = unit_type(world, x, 1, color=C.RED)
+        else:
+            unit = unit_type(world, x, 1)
+
+        # Soldiers are promoted as in play up to the last level their experience can reach.
+        if isinstance(unit, units.Soldier) and level in units.LEVEL_UP_EXPERIENCE_BY_LEVEL:
+            while unit.level < level:
+                unit.experience = units.LEVEL_UP_EXPERIENCE_BY_LEVEL[unit.level]
+                unit.promote()
+        else:
+            unit.level = level
+            unit.damage_index = units.DAMAGE_TABLE.get_index(unit_type.__name__, level)
+        created.append(unit)
+
+    return created
+
+
+class TestDamageTable(unittest.TestCase):
+
+    def test_stats_match_the_formula(self) -> None:
+        for level in LEVELS:
+            for unit in create_units(World(9, 5, level), level):
+                with self.subTest(unit_type=type(unit).__name__, level=level):
+                    self.assertEqual(unit.level, level)
+                    attack, defense = get_stats(type(unit), level)
+                    if isinstance(unit, units.Soldier):
+                        self.assertAlmostEqual(unit.attack, attack)
+                    self.assertAlmostEqual(unit.defense, defense)
+
+    def test_damages_match_the_formula(self) -> None:
+        for attacker_level in LEVELS:
+            attackers = create_units(World(9, 5, attacker_level), attacker_level)
+            for target_level in LEVELS:
+                targets = create_units(World(9, 5, target_level), target_level)
+                for attacker in attackers:
+                    if not isinstance(attacker, units.Soldier):
+                        continue
+
+                    attack, _ = get_stats(type(attacker), attacker_level)
+                    damages = units.DAMAGE_TABLE.get_row(attacker)
+                    for target in targets:
+                        _, defense = get_stats(type(target), target_level)
+                        damage = attack * attacker.attack_multipliers.get(type(target).__name__, 1.0) * (1.0 - defense)
+                        self.assertAlmostEqual(units.DAMAGE_TABLE.get_damage(attacker, target), damage)
+                        self.assertAlmostEqual(damages[target.damage_index], damage)
+
+
+if __name__ == "__main__":
+    unittest.main()
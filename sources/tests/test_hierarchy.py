@@ -0,0 +1,59 @@
+import random
+import unittest
+
+from game.configuration import Configuration as C
+from game.engine import World, units
+from game.engine.hierarchy import ClusterGraph
+from game.engine.pathfinding import INFINITY, DistanceField
+
+
+class TestClusterGraphPaths(unittest.TestCase):
+
+    def assert_path_is_walkable(self, world: World, path: tuple) -> None:
+        for (x, y), (next_x, next_y) in zip(path, path[1:]):
+            self.assertEqual(abs(x - next_x) + abs(y - next_y), 1)
+            self.assertTrue(world.board.is_vacant(next_x, next_y))
+
+    def test_paths_are_as_short_as_along_distance_fields(self) -> None:
+        for seed in range(12):
+            rng = random.Random(seed)
+            width, height = rng.choice(((19, 39), (40, 40), (64, 48)))
+            world = World(width, height, seed)
+            for _ in range(int(width * height * rng.choice((0.0, 0.1, 0.25)))):
+                x, y = rng.randrange(width), rng.randrange(height)
+                if world.board.is_vacant(x, y):
+                    units.Wall(world, x, y)
+
+            graph = world.cluster_graphs.get(0)
+            vacant = [(x, y) for x in range(width) for y in range(height) if world.board.is_vacant(x, y)]
+            for _ in range(40):
+                (x, y), (target_x, target_y) = rng.sample(vacant, 2)
+                target = units.Infantry(world, target_x, target_y, color=C.BLUE)
+                hunter = units.Infantry(world, x, y, color=C.RED)
+                radius = rng.randint(1, 3)
+
+                distance = DistanceField(world.distance_fields, target, radius, 0).get_distance_from(x, y)
+                path = graph.get_path_from(x, y, target, radius, INFINITY)
+                self.assert_path_is_walkable(world, path)
+                if distance == INFINITY:
+                    self.assertEqual(path, ((x, y),))
+                elif distance <= ClusterGraph.CLUSTER_TILE_COUNT:
+                    # Such paths never leave the clusters around the hunter, where tiles are searched exactly.
+                    self.assertEqual(len(path) - 1, distance)
+                else:
+                    self.assertGreaterEqual(len(path) - 1, distance)
+                    self.assertLessEqual(len(path) - 1, distance * 2)
+
+                hunter.perish()
+                target.perish()
+
+    def test_nearby_target_is_approached_directly(self) -> None:
+        world = World(19, 39, 0)
+        target = units.Infantry(world, 3, 35, color=C.BLUE)
+        units.Infantry(world, 3, 30, color=C.RED)
+        path = world.cluster_graphs.get(0).get_path_from(3, 30, target, 3, INFINITY)
+        self.assertEqual(path, ((3, 30), (3, 31), (3, 32)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import random
+import unittest
+
+from game.engine import World
+from game.engine.pathfinding import DistanceField, DistanceFieldCache
+
+MARGINS = (0, 1)
+RADII = (1, 2, 3)
+
+
+class Entity:
+
+    def __init__(self, x: int, y: int) -> None:
+        self.x = x
+        self.y = y
+
+
+class TestDistanceFieldRepair(unittest.TestCase):
+
+    def test_repaired_fields_match_fresh_fields(self) -> None:
+        for seed in range(40):
+            rng = random.Random(seed)
+            width, height = rng.randint(3, 25), rng.randint(3, 15)
+            world = World(width, height, seed)
+            entities = {}
+
+            def occupy(x: int, y: int) -> None:
+                if (x, y) not in entities:
+                    entities[(x, y)] = Entity(x, y)
+                    world.occupy(entities[(x, y)])
+
+            for _ in range(rng.randint(0, width * height // 2)):
+                occupy(rng.randrange(width), rng.randrange(height))
+
+            target = Entity(rng.randrange(width), rng.randrange(height))
+            fields = {
+                (radius, margin): world.distance_fields.get(
+                    target, radius, margin, 0, 0, DistanceFieldCache.SHARING_HUNTER_COUNT
+                )
+                for radius in RADII
+                for margin in MARGINS
+            }
+
+            for _ in range(100):
+                if entities and rng.random() < 0.5:
+                    world.vacate(entities.pop(rng.choice(sorted(entities))))
+                else:
+                    occupy(rng.randrange(width), rng.randrange(height))
+
+                for (radius, margin), field in fields.items():
+                    fresh = DistanceField(world.distance_fields, target, radius, margin)
+                    self.assertEqual(field.distances, fresh.distances)
+
+    def test_bounded_fields_lead_along_the_same_paths(self) -> None:
+        for seed in range(40):
+            rng = random.Random(seed)
+            width, height = rng.randint(3, 25), rng.randint(3, 15)
+            world = World(width, height, seed)
+            for _ in range(rng.randint(0, width * height // 3)):
+                x, y = rng.randrange(width), rng.randrange(height)
+                if world.board.is_vacant(x, y):
+                    world.occupy(Entity(x, y))
+
+            target = Entity(rng.randrange(width), rng.randrange(height))
+            for x in range(width):
+                for y in range(height):
+                    radius, margin = rng.choice(RADII), rng.choice(MARGINS)
+                    field = DistanceField(world.distance_fields, target, radius, margin)
+                    bounded = world.distance_fields.get(target, radius, margin, x, y, 1)
+                    self.assertEqual(bounded.get_path_from(x, y, 100), field.get_path_from(x, y, 100))
+
+
+if __name__ == "__main__":
+    unittest.main()
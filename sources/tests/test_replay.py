@@ -0,0 +1,96 @@
+import random
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+from game.engine import Simulation, World
+from game.engine.replay import ActionLog
+from game.engine.units import MOVE_THEN_HIT, MOVE_THEN_KILL
+from game.engine.waves import COMMON_SOLDIER_TYPE_NAMES
+
+PLAY = Path(__file__).resolve().parent.parent / "play.py"
+
+
+def play_recorded_turn(simulation: Simulation, rng: random.Random) -> None:
+    """
+    Play a turn of simulation, recording the actions of the player as the game objects do.
+    """
+    world = simulation.world
+    action_log = world.action_log
+
+    for building in list(world.critical_buildings):
+        vacant_neighbors = building.get_vacant_neighbors()
+        if vacant_neighbors and world.coin >= 10:
+            soldier_type_name = rng.choice(COMMON_SOLDIER_TYPE_NAMES)
+            x, y = rng.choice(vacant_neighbors)
+            action_log.record_recruit(soldier_type_name, x, y)
+            simulation.recruit(soldier_type_name, x, y)
+
+    for ally in list(world.allied_soldiers):
+        if not world.enemy_soldiers:
+            break
+        if ally not in world.allied_soldiers or ally.attacked_this_turn:
+            continue
+
+        action, path, other = ally.plan_hunt()
+        action_log.record_move(ally, *path[-1])
+        ally.move_to(*path[-1])
+        if action in {MOVE_THEN_HIT, MOVE_THEN_KILL}:
+            action_log.record_attack(ally, other)
+            ally.assault(other)
+            ally.promote()
+
+    action_log.record_end_turn()
+    simulation.end_turn()
+
+
+def get_state(world: World) -> tuple:
+    return (
+        world.day,
+        world.wave,
+        world.coin,
+        world.rng.getstate(),
+        bytes(world.board.occupancy),
+        [
+            [(type(unit).__name__, unit.x, unit.y, unit.health, unit.level, unit.experience) for unit in group]
+            for group in (world.allied_soldiers, world.enemy_soldiers, world.critical_buildings)
+        ],
+    )
+
+
+class TestActionLog(unittest.TestCase):
+
+    def test_replayed_games_end_up_identical(self) -> None:
+        for seed in (0, 1, 2 ** 63 - 1):
+            simulation = Simulation(seed=seed)
+            rng = random.Random(seed)
+            while simulation.outcome is None and simulation.turn < 60:
+                play_recorded_turn(simulation, rng)
+
+            data = simulation.world.action_log.to_bytes()
+            replayed = Simulation.replay(ActionLog.from_bytes(data))
+            self.assertEqual(replayed.world.seed, seed)
+            self.assertEqual(get_state(replayed.world), get_state(simulation.world))
+
+    def test_seeds_outside_int64_are_rejected(self) -> None:
+        for seed in (-1, 2 ** 63, 2 ** 64):
+            with self.assertRaises(ValueError):
+                ActionLog(21, 13, seed)
+            with self.assertRaises(ValueError):
+                World(21, 13, seed)
+
+    def test_command_line_rejects_seeds_outside_int64(self) -> None:
+        for seed in (-1, 2 ** 63):
+            result = subprocess.run(
+                [sys.executable, PLAY, "--seed", str(seed)],
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+            self.assertEqual(result.returncode, 2)
+            self.assertIn("the seed must lie between 0 and 2 ** 63 - 1", result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
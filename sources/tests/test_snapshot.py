@@ -0,0 +1,96 @@
+import mmap
+import tempfile
+import unittest
+from pathlib import Path
+
+from game.engine import Simulation
+from game.engine.snapshot import load_snapshot, save_snapshot
+
+
+def get_state(world) -> tuple:
+    return (
+        world.width,
+        world.height,
+        world.seed,
+        world.day,
+        world.wave,
+        world.coin,
+        world.victorious,
+        world.rng.getstate(),
+        bytes(world.board.lands),
+        bytes(world.board.terrain),
+        bytes(world.board.occupancy),
+        world.action_log.to_bytes(),
+        [
+            [
+                (
+                    type(unit).__name__,
+                    getattr(unit, "color", None),
+                    unit.x,
+                    unit.y,
+                    unit.health,
+                    unit.level,
+                    unit.experience,
+                    unit.attacked_this_turn,
+                    unit.moved_this_turn,
+                    unit.damage_index,
+                )
+                for unit in group
+            ]
+            for group in (
+                world.allied_soldiers,
+                world.enemy_soldiers,
+                world.critical_buildings,
+                world.noncritical_buildings,
+            )
+        ],
+    )
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "game.tkts"
+
+    def load_mapped(self, data: bytes):
+        self.path.write_bytes(data)
+        with open(self.path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as snapshot:
+            return load_snapshot(snapshot)
+
+    def test_loaded_games_play_on_identically(self) -> None:
+        for seed in range(4):
+            simulation = Simulation(seed=seed)
+            for _ in range(15 + seed * 3):
+                simulation.play_turn()
+
+            restored = Simulation(seed=seed)
+            restored.world = self.load_mapped(save_snapshot(simulation.world))
+            self.assertEqual(get_state(restored.world), get_state(simulation.world))
+
+            for _ in range(40):
+                if simulation.outcome is not None:
+                    break
+                simulation.play_turn()
+                restored.play_turn()
+            self.assertEqual(get_state(restored.world), get_state(simulation.world))
+
+    def test_bad_magic_number_is_rejected(self) -> None:
+        data = save_snapshot(Simulation(seed=0).world)
+        with self.assertRaises(ValueError):
+            self.load_mapped(b"XXXX" + data[4:])
+
+    def test_truncated_snapshot_is_rejected(self) -> None:
+        simulation = Simulation(seed=0)
+        for _ in range(5):
+            simulation.play_turn()
+        data = save_snapshot(simulation.world)
+
+        for size in range(1, len(data), 97):
+            with self.subTest(size=size), self.assertRaises(ValueError):
+                self.load_mapped(data[:size])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+from game.configuration import Configuration as C
+from game.engine import World, units
+from game.engine.store import UnitStore
+
+
+class TestUnitStore(unittest.TestCase):
+
+    def test_released_rows_are_reused_with_fresh_defaults(self) -> None:
+        world = World(9, 5, 0)
+        store = world.unit_store
+        survivor = units.Infantry(world, 1, 1, color=C.BLUE)
+        victim = units.Hero(world, 2, 1, color=C.RED)
+        victim.experience = 5
+        victim.promote()
+        victim.attacked_this_turn = victim.moved_this_turn = True
+        survivor.health = 42.0
+
+        row = victim.row
+        row_count = len(store.x)
+        nbytes = store.nbytes
+        victim.take_damage(victim.health)
+        self.assertEqual(len(store), 1)
+        self.assertNotIn(victim, world.enemy_soldiers)
+        self.assertTrue(world.board.is_vacant(2, 1))
+
+        recruit = units.Cavalry(world, 3, 2, color=C.BLUE)
+        self.assertEqual(recruit.row, row)
+        self.assertEqual(len(store), 2)
+        self.assertEqual(len(store.x), row_count)
+        self.assertEqual(store.nbytes, nbytes)
+        self.assertEqual((recruit.x, recruit.y), (3, 2))
+        for name in UnitStore.TYPECODE_BY_COLUMN:
+            if name not in {"x", "y", "damage_index"}:
+                self.assertEqual(getattr(recruit, name), getattr(units.Cavalry, name), name)
+        self.assertEqual(recruit.damage_index, units.DAMAGE_TABLE.get_index("Cavalry", 1))
+        self.assertEqual(recruit.attack, units.Cavalry.attack)
+
+        self.assertEqual((survivor.x, survivor.y, survivor.health), (1, 1, 42.0))
+
+    def test_rows_are_reused_until_none_are_free(self) -> None:
+        world = World(9, 5, 0)
+        store = world.unit_store
+        walls = [units.Wall(world, x, 1) for x in range(1, 8)]
+        for wall in walls[1::2]:
+            wall.perish()
+        free_rows = {wall.row for wall in walls[1::2]}
+
+        recruits = [units.Wall(world, x, 3) for x in range(1, 6)]
+        self.assertEqual({recruit.row for recruit in recruits[:3]}, free_rows)
+        self.assertEqual([recruit.row for recruit in recruits[3:]], [7, 8])
+        self.assertEqual(len(store), 9)
+        self.assertEqual(len({unit.row for unit in walls[::2] + recruits}), 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from game.configuration import Configuration as C
+from game.engine import Simulation, World, units
+from game.engine.waves import WAVE_COUNT, get_spawn_areas, plan_wave
+
+SIZE = C.MINIMUM_LAND_TILE_COUNT
+
+
+class TestWavesOnTheMinimumBoard(unittest.TestCase):
+
+    def test_spawn_areas_do_not_overlap(self) -> None:
+        coordinates = [coordinate for area in get_spawn_areas(SIZE, SIZE) for coordinate in area]
+        self.assertEqual(len(coordinates), len(set(coordinates)))
+        self.assertTrue(all(0 <= x < SIZE and 0 <= y < SIZE for x, y in coordinates))
+
+    def test_waves_spawn_on_distinct_vacant_tiles(self) -> None:
+        for seed in range(20):
+            world = World(SIZE, SIZE, seed)
+            units.Infantry(world, 0, 0, color=C.BLUE)
+            units.Infantry(world, SIZE - 1, SIZE - 1, color=C.BLUE)
+            for wave in range(1, WAVE_COUNT + 1):
+                coordinates = [(x, y) for _, x, y in plan_wave(wave, world.board, world.rng, world.debut_order)]
+                self.assertEqual(len(coordinates), len(set(coordinates)))
+                self.assertTrue(all(world.board.is_vacant(x, y) for x, y in coordinates))
+
+    def test_games_keep_one_unit_per_tile(self) -> None:
+        for seed in range(20):
+            simulation = Simulation(SIZE, SIZE, seed)
+            while simulation.outcome is None and simulation.turn < 200:
+                simulation.play_turn()
+                world = simulation.world
+                unit_count = sum(
+                    len(unit_set)
+                    for unit_set in (
+                        world.allied_soldiers,
+                        world.enemy_soldiers,
+                        world.critical_buildings,
+                        world.noncritical_buildings,
+                    )
+                )
+                self.assertEqual(sum(world.board.occupancy), unit_count)
+
+
+if __name__ == "__main__":
+    unittest.main()